@@ -1,13 +1,23 @@
 """Bot service using aiogram"""
 
-from typing import Optional, Dict, Any
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, Set
 import asyncio
+import logging
+import ssl
+import time
+import certifi
+import orjson
 from aiogram import Bot, Dispatcher
 from aiogram.filters import Command, CommandStart
 from aiogram.types import Message, BotCommand
 from aiogram.enums import ParseMode
 from aiogram.client.default import DefaultBotProperties
 from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
+from aiohttp import web
+from aiolimiter import AsyncLimiter
 
 from app.config import settings
 from app.utils.logger import get_logger
@@ -16,6 +26,111 @@ from app.commands import setup_commands
 
 logger = get_logger(__name__)
 
+# Telegram Bot API limits: ~30 messages/s overall and ~1 message/s per chat
+GLOBAL_SEND_RATE = 30
+PER_CHAT_SEND_RATE = 1
+
+# Seconds a chat's send state outlives its last message: one per-chat limiter period, so the
+# next message to that chat is still rate limited
+CHAT_STATE_IDLE_TTL = 1.0
+
+# Keep-alive connections to api.telegram.org; at GLOBAL_SEND_RATE a handful of warm sockets
+# (plus one held by long polling) carry every request, so bursts reuse them instead of
+# opening new TLS connections
+TELEGRAM_MAX_CONNECTIONS = 10
+
+# Settings are fixed for the process lifetime; bind the access control value once
+_ALLOWED_USER_ID = settings.allowed_user_id
+
+WELCOME_TEXT = """
+🤖 <b>RSS Skull Bot</b>
+
+Welcome! I'm here to help you monitor RSS feeds and send notifications to Telegram.
+
+<b>Available Commands:</b>
+/start - Start the bot
+/help - Show help message
+/list - List your feeds
+/add - Add a new feed (RSS, Reddit, YouTube)
+/remove - Remove a feed
+
+Type /help for more information.
+"""
+
+HELP_TEXT = """
+📖 <b>RSS Skull Bot - Help</b>
+
+<b>Basic Commands:</b>
+/start - Start the bot
+/help - Show this help message
+/ping - Check if bot is alive
+
+<b>Feed Management:</b>
+/add &lt;name&gt; &lt;url&gt; - Add a new feed
+/remove &lt;name&gt; - Remove a feed
+/list - List all your feeds
+/enable &lt;name&gt; - Enable a feed
+/disable &lt;name&gt; - Disable a feed
+/health - Check feed health status
+
+<b>Information & Statistics:</b>
+/stats - Show bot statistics
+/blockstats - Show anti-blocking system statistics
+
+<b>Examples:</b>
+/add MyFeed https://example.com/rss
+/remove MyFeed
+/enable MyFeed
+
+Visit the developer's profile: <a href="https://github.com/runawaydevil">@runawaydevil</a>
+
+Also visit the project repository: https://github.com/runawaydevil/rssskull
+"""
+
+# Command menu registered with Telegram
+BOT_COMMANDS = [
+    BotCommand(command="start", description="Start the bot"),
+    BotCommand(command="help", description="Show help message"),
+    BotCommand(command="list", description="List your feeds"),
+    BotCommand(command="add", description="Add a new feed"),
+    BotCommand(command="remove", description="Remove a feed"),
+    BotCommand(command="enable", description="Enable a feed"),
+    BotCommand(command="disable", description="Disable a feed"),
+    BotCommand(command="health", description="Check feed health"),
+    BotCommand(command="stats", description="Show statistics"),
+    BotCommand(command="blockstats", description="Show anti-blocking statistics"),
+    BotCommand(command="ping", description="Check if bot is alive"),
+]
+
+
+class TelegramSession(AiohttpSession):
+    """aiogram session with a connector tuned for many calls to api.telegram.org
+
+    AiohttpSession builds its connector from _connector_init, so only the connector options
+    are changed here; aiogram still creates and closes the ClientSession itself.
+    """
+
+    def __init__(self, **kwargs):
+        # orjson is much faster than stdlib json for getUpdates/sendMessage payloads
+        kwargs.setdefault("json_loads", orjson.loads)
+        kwargs.setdefault("json_dumps", lambda obj: orjson.dumps(obj).decode())
+        super().__init__(**kwargs)
+        self._connector_init.update(
+            ssl=ssl.create_default_context(cafile=certifi.where()),
+            limit_per_host=TELEGRAM_MAX_CONNECTIONS,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+        )
+
+
+@dataclass(slots=True, eq=False)
+class _ChatSendState:
+    """Per-chat ordering lock and rate limiter, dropped once the chat goes idle"""
+
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    limiter: AsyncLimiter = field(default_factory=lambda: AsyncLimiter(PER_CHAT_SEND_RATE, 1))
+    users: int = 0  # sends holding or waiting for this state
+
 
 class BotService:
     """Bot service for Telegram bot using aiogram"""
@@ -25,8 +140,22 @@ class BotService:
         self.dp: Optional[Dispatcher] = None
         self.bot_username: Optional[str] = None
         self.bot_id: Optional[int] = None
+        # Static bot identity, built once in initialize() for stats/metrics
+        self._bot_info: Dict[str, Any] = {"username": None, "id": None}
+        self._bot_metrics: Dict[str, Any] = {"bot_username": None, "bot_id": None}
         self.is_polling = False
+        self.is_webhook = False
         self._polling_task = None
+        self._webhook_runner: Optional[web.AppRunner] = None
+        self._last_healthcheck = 0.0  # monotonic time of last successful get_me()
+        self._healthcheck_ttl = 30.0  # seconds
+        # Outgoing messages are funnelled through a rate-limited sender task
+        self._send_queue: Optional[asyncio.Queue] = None
+        self._sender_task: Optional[asyncio.Task] = None
+        self._global_limiter = AsyncLimiter(GLOBAL_SEND_RATE, 1)
+        # Only chats with a send in progress (or within CHAT_STATE_IDLE_TTL of one) have an entry
+        self._chat_states: Dict[int, _ChatSendState] = {}
+        self._send_tasks: Set[asyncio.Task] = set()
 
     async def initialize(self):
         """Initialize bot"""
@@ -34,7 +163,7 @@ class BotService:
             logger.info("🔧 Initializing bot service...")
 
             # Create bot instance
-            session = AiohttpSession()
+            session = TelegramSession()
             self.bot = Bot(
                 token=settings.bot_token,
                 session=session,
@@ -48,6 +177,8 @@ class BotService:
             me = await self.bot.get_me()
             self.bot_username = me.username
             self.bot_id = me.id
+            self._bot_info = {"username": me.username, "id": me.id}
+            self._bot_metrics = {"bot_username": me.username, "bot_id": me.id}
 
             logger.info(f"✅ Bot initialized: @{self.bot_username} ({me.first_name})")
 
@@ -63,6 +194,10 @@ class BotService:
             # Register bot commands
             await self._set_bot_commands()
 
+            # Start rate-limited message sender
+            self._send_queue = asyncio.Queue()
+            self._sender_task = asyncio.create_task(self._sender_loop())
+
             logger.info("✅ Bot service initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize bot: {e}")
@@ -76,16 +211,20 @@ class BotService:
         # Logging middleware
         @self.dp.message.middleware()
         async def logging_middleware(handler, event: Message, data: Dict[str, Any]):
-            user = event.from_user.first_name if event.from_user else "Unknown"
-            chat_type = event.chat.type if event.chat else "unknown"
-            text = event.text or ""
-            logger.info(
-                f"📨 Message received: '{text}' from {user} in {chat_type} chat",
-                extra={
-                    "chatId": event.chat.id if event.chat else None,
-                    "userId": event.from_user.id if event.from_user else None,
-                },
-            )
+            # Runs for every update: skip all formatting work when INFO is filtered out
+            if logger.isEnabledFor(logging.INFO):
+                from_user = event.from_user
+                chat = event.chat
+                logger.info(
+                    "📨 Message received: '%s' from %s in %s chat",
+                    event.text or "",
+                    from_user.first_name if from_user else "Unknown",
+                    chat.type if chat else "unknown",
+                    extra={
+                        "chatId": chat.id if chat else None,
+                        "userId": from_user.id if from_user else None,
+                    },
+                )
             return await handler(event, data)
 
     def _setup_handlers(self):
@@ -99,59 +238,16 @@ class BotService:
             user_id = message.from_user.id if message.from_user else None
 
             # Check if user is allowed
-            if settings.allowed_user_id and user_id != settings.allowed_user_id:
+            if _ALLOWED_USER_ID and user_id != _ALLOWED_USER_ID:
                 await message.answer("❌ You are not authorized to use this bot.")
                 return
 
-            welcome_text = """
-🤖 <b>RSS Skull Bot</b>
-
-Welcome! I'm here to help you monitor RSS feeds and send notifications to Telegram.
-
-<b>Available Commands:</b>
-/start - Start the bot
-/help - Show help message
-/list - List your feeds
-/add - Add a new feed (RSS, Reddit, YouTube)
-/remove - Remove a feed
-
-Type /help for more information.
-"""
-            await message.answer(welcome_text)
+            await message.answer(WELCOME_TEXT)
 
         # Help command
         @self.dp.message(Command("help"))
         async def help_command(message: Message):
-            help_text = """
-📖 <b>RSS Skull Bot - Help</b>
-
-<b>Basic Commands:</b>
-/start - Start the bot
-/help - Show this help message
-/ping - Check if bot is alive
-
-<b>Feed Management:</b>
-/add &lt;name&gt; &lt;url&gt; - Add a new feed
-/remove &lt;name&gt; - Remove a feed
-/list - List all your feeds
-/enable &lt;name&gt; - Enable a feed
-/disable &lt;name&gt; - Disable a feed
-/health - Check feed health status
-
-<b>Information & Statistics:</b>
-/stats - Show bot statistics
-/blockstats - Show anti-blocking system statistics
-
-<b>Examples:</b>
-/add MyFeed https://example.com/rss
-/remove MyFeed
-/enable MyFeed
-
-Visit the developer's profile: <a href="https://github.com/runawaydevil">@runawaydevil</a>
-
-Also visit the project repository: https://github.com/runawaydevil/rssskull
-"""
-            await message.answer(help_text)
+            await message.answer(HELP_TEXT)
 
         # Ping command
         @self.dp.message(Command("ping"))
@@ -170,22 +266,8 @@ Also visit the project repository: https://github.com/runawaydevil/rssskull
         if not self.bot:
             return
 
-        commands = [
-            BotCommand(command="start", description="Start the bot"),
-            BotCommand(command="help", description="Show help message"),
-            BotCommand(command="list", description="List your feeds"),
-            BotCommand(command="add", description="Add a new feed"),
-            BotCommand(command="remove", description="Remove a feed"),
-            BotCommand(command="enable", description="Enable a feed"),
-            BotCommand(command="disable", description="Disable a feed"),
-            BotCommand(command="health", description="Check feed health"),
-            BotCommand(command="stats", description="Show statistics"),
-            BotCommand(command="blockstats", description="Show anti-blocking statistics"),
-            BotCommand(command="ping", description="Check if bot is alive"),
-        ]
-
         try:
-            await self.bot.set_my_commands(commands)
+            await self.bot.set_my_commands(BOT_COMMANDS)
             logger.info("✅ Bot commands registered")
         except Exception as e:
             logger.error(f"Failed to register bot commands: {e}")
@@ -214,13 +296,86 @@ Also visit the project repository: https://github.com/runawaydevil/rssskull
             # Store the task so we can cancel it later
             import asyncio
 
-            self._polling_task = asyncio.create_task(self.dp.start_polling(self.bot))
+            # Only request the update types our handlers consume (just "message" today)
+            self._polling_task = asyncio.create_task(
+                self.dp.start_polling(
+                    self.bot,
+                    polling_timeout=settings.polling_timeout,
+                    allowed_updates=self.dp.resolve_used_update_types(),
+                )
+            )
             logger.info("✅ Bot polling started")
         except Exception as e:
             self.is_polling = False
             logger.error(f"Failed to start polling: {e}")
             raise
 
+    async def start_webhook(
+        self, url: str, secret_token: Optional[str] = None, path: str = "/telegram/webhook"
+    ):
+        """Start receiving updates through a Telegram webhook"""
+        if not self.bot or not self.dp:
+            raise RuntimeError("Bot not initialized. Call initialize() first.")
+
+        if self.is_webhook:
+            logger.warning("Bot webhook is already running")
+            return
+
+        try:
+            logger.info("🔧 Starting bot webhook...")
+
+            webhook_url = url.rstrip("/") + path
+            # Updates sent while the bot was down are kept and delivered to the new webhook
+            await self.bot.set_webhook(
+                webhook_url,
+                secret_token=secret_token,
+                allowed_updates=self.dp.resolve_used_update_types(),
+            )
+
+            # Mount aiogram's request handler on a dedicated aiohttp server
+            app = web.Application()
+            SimpleRequestHandler(
+                dispatcher=self.dp, bot=self.bot, secret_token=secret_token
+            ).register(app, path=path)
+            setup_application(app, self.dp, bot=self.bot)
+
+            self._webhook_runner = web.AppRunner(app)
+            await self._webhook_runner.setup()
+            site = web.TCPSite(
+                self._webhook_runner, host=settings.webhook_host, port=settings.webhook_port
+            )
+            await site.start()
+
+            self.is_webhook = True
+            logger.info(
+                f"✅ Bot webhook started on {settings.webhook_host}:{settings.webhook_port}{path}"
+            )
+        except Exception as e:
+            self.is_webhook = False
+            if self._webhook_runner:
+                await self._webhook_runner.cleanup()
+                self._webhook_runner = None
+            logger.error(f"Failed to start webhook: {e}")
+            raise
+
+    async def stop_webhook(self):
+        """Stop the webhook server"""
+        if not self.is_webhook:
+            return
+
+        try:
+            logger.info("🛑 Stopping bot webhook...")
+            if self._webhook_runner:
+                await self._webhook_runner.cleanup()
+            if self.bot:
+                await self.bot.delete_webhook()
+            logger.info("✅ Bot webhook stopped")
+        except Exception as e:
+            logger.error(f"Failed to stop webhook: {e}")
+        finally:
+            self.is_webhook = False
+            self._webhook_runner = None
+
     async def stop_polling(self):
         """Stop bot polling"""
         if not self.is_polling:
@@ -228,14 +383,19 @@ Also visit the project repository: https://github.com/runawaydevil/rssskull
 
         try:
             logger.info("🛑 Stopping bot polling...")
-            if self._polling_task:
-                self._polling_task.cancel()
+            # Ask aiogram to leave its loop cleanly before resorting to cancellation
+            if self.dp:
+                try:
+                    await self.dp.stop_polling()
+                except RuntimeError:
+                    pass  # Polling loop already exited
+            if self._polling_task and not self._polling_task.done():
                 try:
-                    await self._polling_task
-                except asyncio.CancelledError:
+                    # Bounded wait: a getUpdates stuck in TLS must not hang shutdown.
+                    # wait_for cancels the task itself when the timeout expires.
+                    await asyncio.wait_for(self._polling_task, timeout=5.0)
+                except (asyncio.CancelledError, asyncio.TimeoutError):
                     pass
-            if self.dp:
-                await self.dp.stop_polling()
             self.is_polling = False
             self._polling_task = None
             logger.info("✅ Bot polling stopped")
@@ -248,17 +408,32 @@ Also visit the project repository: https://github.com/runawaydevil/rssskull
         if not self.bot:
             return False
 
+        # Trust a recent successful get_me() while the update loop is still running
+        receiving = self.is_webhook or (
+            self._polling_task is not None and not self._polling_task.done()
+        )
+        if receiving and time.monotonic() - self._last_healthcheck < self._healthcheck_ttl:
+            return True
+
         try:
             # Try to get bot info to verify connection
             await self.bot.get_me()
-            return self.is_polling
+            self._last_healthcheck = time.monotonic()
+            return self.is_polling or self.is_webhook
         except Exception:
+            self._last_healthcheck = 0.0
             return False
 
     async def restart_polling_if_needed(self) -> bool:
         """Restart polling if it's not active"""
+        if self.is_webhook:
+            # Updates are pushed by Telegram, nothing to restart
+            return False
+
         try:
-            if not await self.is_polling_active():
+            # A finished polling task means the loop died, no network check needed
+            polling_died = self._polling_task is not None and self._polling_task.done()
+            if polling_died or not await self.is_polling_active():
                 logger.warn("Bot polling is not active - restarting...")
                 await self.stop_polling()
                 await self.start_polling()
@@ -269,22 +444,113 @@ Also visit the project repository: https://github.com/runawaydevil/rssskull
             return False
 
     async def send_message(self, chat_id: int, text: str, **kwargs) -> Optional[Message]:
-        """Send a message"""
+        """Send a message (queued and rate limited to Telegram's limits)"""
         if not self.bot:
             raise RuntimeError("Bot not initialized")
 
+        if not self._send_queue or not self._sender_task or self._sender_task.done():
+            return await self._deliver(chat_id, text, **kwargs)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._send_queue.put((chat_id, text, kwargs, future))
+        return await future
+
+    async def _deliver(self, chat_id: int, text: str, **kwargs) -> Optional[Message]:
+        """Send a message right away, honouring one RetryAfter from Telegram"""
         try:
-            return await self.bot.send_message(chat_id=chat_id, text=text, **kwargs)
+            try:
+                return await self.bot.send_message(chat_id=chat_id, text=text, **kwargs)
+            except TelegramRetryAfter as e:
+                logger.warning(f"Rate limited by Telegram, retrying in {e.retry_after}s")
+                await asyncio.sleep(e.retry_after)
+                return await self.bot.send_message(chat_id=chat_id, text=text, **kwargs)
         except Exception as e:
             logger.error(f"Failed to send message to {chat_id}: {e}")
             return None
 
+    async def _sender_loop(self):
+        """Hand queued messages to per-message tasks so one chat's limit never blocks another"""
+        while True:
+            chat_id, text, kwargs, future = await self._send_queue.get()
+            task = asyncio.create_task(self._send_queued(chat_id, text, kwargs, future))
+            self._send_tasks.add(task)
+            task.add_done_callback(self._send_tasks.discard)
+
+    async def _send_queued(
+        self, chat_id: int, text: str, kwargs: Dict[str, Any], future: asyncio.Future
+    ):
+        """Send one queued message at no more than the global and per-chat rates"""
+        state = self._chat_states.get(chat_id)
+        if state is None:
+            state = self._chat_states[chat_id] = _ChatSendState()
+        state.users += 1
+        try:
+            # The lock (FIFO) keeps messages to the same chat in the order they were queued
+            async with state.lock:
+                async with state.limiter:
+                    async with self._global_limiter:
+                        result = await self._deliver(chat_id, text, **kwargs)
+            if not future.done():
+                future.set_result(result)
+        except asyncio.CancelledError:
+            if not future.done():
+                future.set_result(None)
+            raise
+        except Exception as e:
+            logger.error(f"Message sender error for {chat_id}: {e}")
+            if not future.done():
+                future.set_result(None)
+        finally:
+            self._send_queue.task_done()
+            state.users -= 1
+            if not state.users:
+                asyncio.get_running_loop().call_later(
+                    CHAT_STATE_IDLE_TTL, self._evict_chat_state, chat_id, state
+                )
+
+    def _evict_chat_state(self, chat_id: int, state: _ChatSendState):
+        """Drop a chat's send state if no message to it arrived since it went idle"""
+        if not state.users and self._chat_states.get(chat_id) is state:
+            del self._chat_states[chat_id]
+
+    async def _stop_sender(self):
+        """Let queued messages drain briefly, then stop the sender task"""
+        if not self._sender_task:
+            return
+
+        if self._send_queue:
+            try:
+                await asyncio.wait_for(self._send_queue.join(), timeout=5.0)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Dropping {self._send_queue.qsize()} queued message(s) on shutdown"
+                )
+
+        self._sender_task.cancel()
+        try:
+            await self._sender_task
+        except asyncio.CancelledError:
+            pass
+        self._sender_task = None
+
+        # Cancel sends still waiting on a rate limit; they resolve their callers with None
+        for task in list(self._send_tasks):
+            task.cancel()
+        if self._send_tasks:
+            await asyncio.gather(*self._send_tasks, return_exceptions=True)
+
+        # Release callers still waiting on messages that were never sent
+        while self._send_queue and not self._send_queue.empty():
+            _, _, _, future = self._send_queue.get_nowait()
+            if not future.done():
+                future.set_result(None)
+
     async def get_metrics(self) -> Dict[str, Any]:
         """Get bot metrics"""
         return {
-            "bot_username": self.bot_username,
-            "bot_id": self.bot_id,
+            **self._bot_metrics,
             "is_polling": self.is_polling,
+            "is_webhook": self.is_webhook,
         }
 
     async def get_stats(self) -> Dict[str, Any]:
@@ -292,9 +558,9 @@ Also visit the project repository: https://github.com/runawaydevil/rssskull
         # Get feed stats from database
         stats = {
             "bot": {
-                "username": self.bot_username,
-                "id": self.bot_id,
+                **self._bot_info,
                 "polling": self.is_polling,
+                "webhook": self.is_webhook,
             }
         }
 
@@ -308,6 +574,8 @@ Also visit the project repository: https://github.com/runawaydevil/rssskull
         """Close bot connections"""
         try:
             await self.stop_polling()
+            await self.stop_webhook()
+            await self._stop_sender()
             if self.bot:
                 session = self.bot.session
                 if session:
@@ -1,405 +1,383 @@
 """Feed management commands"""
 
-from typing import Optional
+from functools import partial
+from typing import Optional, Any, Awaitable, Callable, Dict
 from aiogram import Dispatcher, Bot
 from aiogram.types import Message
-from aiogram.filters import Command
+from aiogram.filters import Command, CommandObject
 
+from app.database import database
+from app.services.blocking_stats_service import BlockingStatsService
 from app.services.feed_service import feed_service
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-
-async def setup_feed_commands(dp: Optional[Dispatcher], bot: Optional[Bot]):
-    """Setup feed management commands"""
-    if not dp:
-        return
-
-    # List feeds command
-    @dp.message(Command("list"))
-    async def list_feeds_command(message: Message):
-        """List all feeds for the chat"""
-        chat_id = str(message.chat.id)
-
-        try:
-            feeds = await feed_service.list_feeds(chat_id)
-
-            if not feeds:
-                await message.answer("📋 <b>No feeds configured.</b>\n\nUse /add to add a feed.")
-                return
-
-            feed_list = []
-            for i, feed in enumerate(feeds, 1):
-                status = "✅" if feed.enabled else "❌"
-                feed_list.append(f"{i}. {status} <b>{feed.name}</b>\n🔗 {feed.url}")
-
-            response = f"📋 <b>Your RSS Feeds ({len(feeds)}):</b>\n\n" + "\n\n".join(feed_list)
-            await message.answer(response)
-        except Exception as e:
-            logger.error(f"Failed to list feeds for {chat_id}: {e}")
-            await message.answer("❌ Failed to list feeds. Please try again.")
-
-    # Add feed command
-    @dp.message(Command("add"))
-    async def add_feed_command(message: Message):
-        """Add a new feed"""
-        chat_id = str(message.chat.id)
-        args = message.text.split()[1:] if message.text else []
-
-        if len(args) < 2:
-            await message.answer(
-                "❌ <b>Invalid syntax.</b>\n\n"
-                "Usage: /add &lt;name&gt; &lt;url&gt;\n\n"
-                "Examples:\n"
-                "• RSS: /add MyFeed https://example.com/rss\n"
-                "• Reddit: /add Subreddit https://reddit.com/r/subreddit\n"
-                "• YouTube: /add Channel youtube.com/@username\n"
-                "• YouTube: /add Channel youtube.com/channel/UCxxxxx"
-            )
+# Feed status icon indexed by Feed.enabled (False -> 0, True -> 1)
+STATUS_ICON = ("❌", "✅")
+
+# Usage replies for commands called without their arguments
+ADD_USAGE = (
+    "❌ <b>Invalid syntax.</b>\n\n"
+    "Usage: /add &lt;name&gt; &lt;url&gt;\n\n"
+    "Examples:\n"
+    "• RSS: /add MyFeed https://example.com/rss\n"
+    "• Reddit: /add Subreddit https://reddit.com/r/subreddit\n"
+    "• YouTube: /add Channel youtube.com/@username\n"
+    "• YouTube: /add Channel youtube.com/channel/UCxxxxx"
+)
+REMOVE_USAGE = (
+    "❌ <b>Invalid syntax.</b>\n\n" "Usage: /remove &lt;name&gt;\n\n" "Example: /remove MyFeed"
+)
+ENABLE_USAGE = (
+    "❌ <b>Invalid syntax.</b>\n\n" "Usage: /enable &lt;name&gt;\n\n" "Example: /enable MyFeed"
+)
+DISABLE_USAGE = (
+    "❌ <b>Invalid syntax.</b>\n\n" "Usage: /disable &lt;name&gt;\n\n" "Example: /disable MyFeed"
+)
+
+
+async def list_feeds_command(message: Message, command: Optional[CommandObject] = None):
+    """List all feeds for the chat"""
+    chat_id = str(message.chat.id)
+
+    try:
+        feeds = await feed_service.list_feeds(chat_id)
+
+        if not feeds:
+            await message.answer("📋 <b>No feeds configured.</b>\n\nUse /add to add a feed.")
             return
 
-        name = args[0]
-        url = " ".join(args[1:])  # URL might contain spaces
-
-        try:
-            result = await feed_service.add_feed(chat_id, name, url)
-
-            if result.get("success"):
-                await message.answer(
-                    f"✅ <b>Feed added successfully!</b>\n\n" f"Name: <b>{name}</b>\n" f"URL: {url}"
-                )
-            else:
-                error = result.get("error", "Unknown error")
-                await message.answer(f"❌ <b>Failed to add feed:</b> {error}")
-        except Exception as e:
-            logger.error(f"Failed to add feed for {chat_id}: {e}")
-            await message.answer("❌ Failed to add feed. Please try again.")
-
-    # Remove feed command
-    @dp.message(Command("remove"))
-    async def remove_feed_command(message: Message):
-        """Remove a feed"""
-        chat_id = str(message.chat.id)
-        args = message.text.split()[1:] if message.text else []
-
-        if len(args) < 1:
-            await message.answer(
-                "❌ <b>Invalid syntax.</b>\n\n"
-                "Usage: /remove &lt;name&gt;\n\n"
-                "Example: /remove MyFeed"
-            )
-            return
+        parts = [f"📋 <b>Your RSS Feeds ({len(feeds)}):</b>\n\n"]
+        for i, feed in enumerate(feeds, 1):
+            parts.append(f"{i}. {STATUS_ICON[feed.enabled]} <b>{feed.name}</b>\n🔗 {feed.url}\n\n")
+
+        await message.answer("".join(parts).rstrip())
+    except Exception as e:
+        logger.error(f"Failed to list feeds for {chat_id}: {e}")
+        await message.answer("❌ Failed to list feeds. Please try again.")
+
+
+async def _run_feed_op(
+    message: Message,
+    command: CommandObject,
+    *,
+    op_name: str,
+    arg_count: int,
+    usage: str,
+    service_fn: Callable[..., Awaitable[Dict[str, Any]]],
+    success_fmt: str,
+    default_error: str = "Feed not found",
+):
+    """Parse arguments, run a feed service operation and report the result
+
+    The feed name is always the first token; words after it are ignored by single-argument
+    commands, while /add's second argument receives the rest of the line (the URL intact).
+    """
+    chat_id = str(message.chat.id)
+    args = (command.args or "").split(maxsplit=1)[:arg_count]
+
+    if len(args) < arg_count:
+        await message.answer(usage)
+        return
+    args[-1] = args[-1].strip()
 
-        name = args[0]
+    try:
+        result = await service_fn(chat_id, *args)
 
-        try:
-            result = await feed_service.remove_feed(chat_id, name)
+        if result.get("success"):
+            await message.answer(success_fmt.format(*args))
+        else:
+            error = result.get("error", default_error)
+            await message.answer(f"❌ <b>Failed to {op_name} feed:</b> {error}")
+    except Exception as e:
+        logger.error(f"Failed to {op_name} feed for {chat_id}: {e}")
+        await message.answer(f"❌ Failed to {op_name} feed. Please try again.")
 
-            if result.get("success"):
-                await message.answer(f"✅ <b>Feed removed:</b> {name}")
-            else:
-                error = result.get("error", "Feed not found")
-                await message.answer(f"❌ <b>Failed to remove feed:</b> {error}")
-        except Exception as e:
-            logger.error(f"Failed to remove feed for {chat_id}: {e}")
-            await message.answer("❌ Failed to remove feed. Please try again.")
-
-    # Enable feed command
-    @dp.message(Command("enable"))
-    async def enable_feed_command(message: Message):
-        """Enable a feed"""
-        chat_id = str(message.chat.id)
-        args = message.text.split()[1:] if message.text else []
-
-        if len(args) < 1:
-            await message.answer(
-                "❌ <b>Invalid syntax.</b>\n\n"
-                "Usage: /enable &lt;name&gt;\n\n"
-                "Example: /enable MyFeed"
-            )
-            return
 
-        name = args[0]
+async def health_command(message: Message, command: Optional[CommandObject] = None):
+    """Check health of all feeds"""
+    chat_id = str(message.chat.id)
 
-        try:
-            result = await feed_service.enable_feed(chat_id, name)
+    try:
+        feeds = await feed_service.list_feeds(chat_id)
 
-            if result.get("success"):
-                await message.answer(f"✅ <b>Feed enabled:</b> {name}")
-            else:
-                error = result.get("error", "Feed not found")
-                await message.answer(f"❌ <b>Failed to enable feed:</b> {error}")
-        except Exception as e:
-            logger.error(f"Failed to enable feed for {chat_id}: {e}")
-            await message.answer("❌ Failed to enable feed. Please try again.")
-
-    # Disable feed command
-    @dp.message(Command("disable"))
-    async def disable_feed_command(message: Message):
-        """Disable a feed"""
-        chat_id = str(message.chat.id)
-        args = message.text.split()[1:] if message.text else []
-
-        if len(args) < 1:
-            await message.answer(
-                "❌ <b>Invalid syntax.</b>\n\n"
-                "Usage: /disable &lt;name&gt;\n\n"
-                "Example: /disable MyFeed"
-            )
+        if not feeds:
+            await message.answer("📋 No feeds configured.")
             return
 
-        name = args[0]
-
-        try:
-            result = await feed_service.disable_feed(chat_id, name)
+        # Check for feeds with high failure rates
+        problem_feeds = []
+        healthy_feeds = []
 
-            if result.get("success"):
-                await message.answer(f"❌ <b>Feed disabled:</b> {name}")
+        for feed in feeds:
+            if feed.failures >= 3:
+                problem_feeds.append(feed)
             else:
-                error = result.get("error", "Feed not found")
-                await message.answer(f"❌ <b>Failed to disable feed:</b> {error}")
-        except Exception as e:
-            logger.error(f"Failed to disable feed for {chat_id}: {e}")
-            await message.answer("❌ Failed to disable feed. Please try again.")
+                healthy_feeds.append(feed)
+
+        response = "🏥 <b>Feed Health Report</b>\n\n"
+
+        if problem_feeds:
+            response += "❌ <b>Problem Feeds:</b>\n"
+            for feed in problem_feeds:
+                response += f"• <b>{feed.name}</b>\n"
+                response += f"  URL: {feed.url}\n"
+                response += f"  Failures: {feed.failures}\n"
+                response += f"  Status: {'Enabled' if feed.enabled else 'Disabled'}\n\n"
+
+        if healthy_feeds:
+            response += f"✅ <b>Healthy Feeds:</b> {len(healthy_feeds)}\n"
+
+        if problem_feeds:
+            response += "\n💡 <b>Tip:</b> Use /remove &lt;name&gt; to remove problematic feeds."
+
+        await message.answer(response)
+    except Exception as e:
+        logger.error(f"Failed to check feed health for {chat_id}: {e}")
+        await message.answer("❌ Failed to check feed health. Please try again.")
+
+
+async def blockstats_command(message: Message, command: Optional[CommandObject] = None):
+    """Show blocking statistics"""
+    try:
+        # Only load data inside the session; build the reply after it is closed
+        with database.get_session() as session:
+            stats_service = BlockingStatsService(session)
+            report = stats_service.get_full_report(low_success_threshold=50.0)
+        summary = report["summary"]
+        sorted_stats = report["stats"]
+        low_success_domains = report["low_success"]
+
+        parts = ["📊 <b>Anti-Blocking Statistics</b>\n\n"]
+
+        # Overall summary
+        if summary["total_requests"] > 0:
+            parts.append("<b>📈 Overall Performance:</b>\n")
+            parts.append(f"• Total Requests: {summary['total_requests']}\n")
+            parts.append(f"• Success Rate: {summary['overall_success_rate']:.1f}%\n")
+            parts.append(f"• Blocked (403): {summary['blocked_requests']}\n")
+            parts.append(f"• Rate Limited (429): {summary['rate_limited_requests']}\n")
+            parts.append(f"• Domains Tracked: {summary['total_domains']}\n\n")
+
+        # Per-domain statistics (top 10 by request count)
+        if sorted_stats:
+            parts.append("<b>🌐 Top Domains:</b>\n")
+            for stat in sorted_stats[:10]:
+                success_rate = (
+                    (stat.successful_requests / stat.total_requests * 100)
+                    if stat.total_requests > 0
+                    else 0.0
+                )
+                status_icon = "✅" if success_rate >= 80 else "⚠️" if success_rate >= 50 else "❌"
+                parts.append(f"{status_icon} <b>{stat.domain}</b>\n")
+                parts.append(
+                    f"  Success: {success_rate:.1f}% ({stat.successful_requests}/{stat.total_requests})\n"
+                )
+                if stat.blocked_requests > 0:
+                    parts.append(f"  Blocked: {stat.blocked_requests}\n")
+                if stat.rate_limited_requests > 0:
+                    parts.append(f"  Rate Limited: {stat.rate_limited_requests}\n")
+                parts.append(f"  Delay: {stat.current_delay:.1f}s\n")
+                if stat.circuit_breaker_state != "closed":
+                    cb_icon = "🔴" if stat.circuit_breaker_state == "open" else "🟡"
+                    parts.append(f"  {cb_icon} Circuit: {stat.circuit_breaker_state}\n")
+            parts.append("\n")
+
+        # Circuit breaker summary
+        if summary["circuit_breaker_open"] > 0 or summary["circuit_breaker_half_open"] > 0:
+            parts.append("<b>⚡ Circuit Breakers:</b>\n")
+            if summary["circuit_breaker_open"] > 0:
+                parts.append(f"🔴 Open: {summary['circuit_breaker_open']}\n")
+            if summary["circuit_breaker_half_open"] > 0:
+                parts.append(f"🟡 Testing: {summary['circuit_breaker_half_open']}\n")
+            parts.append("\n")
+
+        # Low success rate domains
+        if low_success_domains:
+            parts.append("<b>⚠️ Low Success Rate Domains:</b>\n")
+            for stat in low_success_domains[:5]:
+                success_rate = (
+                    (stat.successful_requests / stat.total_requests * 100)
+                    if stat.total_requests > 0
+                    else 0.0
+                )
+                parts.append(f"• {stat.domain}: {success_rate:.1f}%\n")
+            parts.append("\n")
+
+        if summary["total_requests"] == 0:
+            parts.append("ℹ️ No blocking data yet.\n")
+
+        await message.answer("".join(parts))
+    except Exception as e:
+        logger.error(f"Failed to get block stats: {e}")
+        await message.answer("❌ Failed to get statistics. Please try again.")
+
+
+async def stats_command(message: Message, command: Optional[CommandObject] = None):
+    """Show bot statistics"""
+    chat_id = str(message.chat.id)
+
+    try:
+        from app.bot import bot_service
+        from datetime import datetime
+
+        with database.get_session() as session:
+            from sqlmodel import select
+            from app.models.feed import Feed
+
+            feeds = session.exec(select(Feed).where(Feed.chat_id == chat_id)).all()
+            enabled_count = sum(1 for f in feeds if f.enabled)
+            disabled_count = len(feeds) - enabled_count
+
+            # Helper function to format time ago
+            def format_time_ago(dt: Optional[datetime]) -> str:
+                if not dt:
+                    return "never"
+                now = datetime.utcnow()
+                diff = now - dt
+                if diff.total_seconds() < 60:
+                    return f"{int(diff.total_seconds())}s ago"
+                elif diff.total_seconds() < 3600:
+                    return f"{int(diff.total_seconds() / 60)}m ago"
+                elif diff.total_seconds() < 86400:
+                    return f"{int(diff.total_seconds() / 3600)}h ago"
+                else:
+                    return f"{int(diff.total_seconds() / 86400)}d ago"
 
-    # Check feed health command
-    @dp.message(Command("health"))
-    async def health_command(message: Message):
-        """Check health of all feeds"""
-        chat_id = str(message.chat.id)
+            # Build response with emojis
+            response = "📊 <b>Bot Statistics</b>\n\n"
 
-        try:
-            feeds = await feed_service.list_feeds(chat_id)
+            # Feed overview
+            response += "📋 <b>Your Feeds Overview</b>\n"
+            response += f"✅ Enabled: {enabled_count} | ❌ Disabled: {disabled_count} | 📊 Total: {len(feeds)}\n\n"
 
             if not feeds:
-                await message.answer("📋 No feeds configured.")
+                response += "ℹ️ No feeds configured yet. Use /add to add a feed.\n"
+                await message.answer(response)
                 return
 
-            # Check for feeds with high failure rates
-            problem_feeds = []
-            healthy_feeds = []
-
-            for feed in feeds:
-                if feed.failures >= 3:
-                    problem_feeds.append(feed)
-                else:
-                    healthy_feeds.append(feed)
-
-            response = "🏥 <b>Feed Health Report</b>\n\n"
-
-            if problem_feeds:
-                response += "❌ <b>Problem Feeds:</b>\n"
-                for feed in problem_feeds:
-                    response += f"• <b>{feed.name}</b>\n"
-                    response += f"  URL: {feed.url}\n"
-                    response += f"  Failures: {feed.failures}\n"
-                    response += f"  Status: {'Enabled' if feed.enabled else 'Disabled'}\n\n"
-
-            if healthy_feeds:
-                response += f"✅ <b>Healthy Feeds:</b> {len(healthy_feeds)}\n"
-
-            if problem_feeds:
-                response += "\n💡 <b>Tip:</b> Use /remove &lt;name&gt; to remove problematic feeds."
-
-            await message.answer(response)
-        except Exception as e:
-            logger.error(f"Failed to check feed health for {chat_id}: {e}")
-            await message.answer("❌ Failed to check feed health. Please try again.")
-
-    # Block stats command
-    @dp.message(Command("blockstats"))
-    async def blockstats_command(message: Message):
-        """Show blocking statistics"""
-        try:
-            from app.database import database
-            from app.services.blocking_stats_service import BlockingStatsService
-
-            response = "📊 <b>Anti-Blocking Statistics</b>\n\n"
-
-            # Get database statistics
-            with database.get_session() as session:
-                stats_service = BlockingStatsService(session)
-                summary = stats_service.get_summary()
-                all_stats = stats_service.get_all_stats()
-
-                # Overall summary
-                if summary["total_requests"] > 0:
-                    response += "<b>📈 Overall Performance:</b>\n"
-                    response += f"• Total Requests: {summary['total_requests']}\n"
-                    response += f"• Success Rate: {summary['overall_success_rate']:.1f}%\n"
-                    response += f"• Blocked (403): {summary['blocked_requests']}\n"
-                    response += f"• Rate Limited (429): {summary['rate_limited_requests']}\n"
-                    response += f"• Domains Tracked: {summary['total_domains']}\n\n"
-
-                # Per-domain statistics (top 10 by request count)
-                if all_stats:
-                    sorted_stats = sorted(all_stats, key=lambda x: x.total_requests, reverse=True)
-                    response += "<b>🌐 Top Domains:</b>\n"
-                    for stat in sorted_stats[:10]:
-                        success_rate = (
-                            (stat.successful_requests / stat.total_requests * 100)
-                            if stat.total_requests > 0
-                            else 0.0
-                        )
-                        status_icon = (
-                            "✅" if success_rate >= 80 else "⚠️" if success_rate >= 50 else "❌"
-                        )
-                        response += f"{status_icon} <b>{stat.domain}</b>\n"
-                        response += f"  Success: {success_rate:.1f}% ({stat.successful_requests}/{stat.total_requests})\n"
-                        if stat.blocked_requests > 0:
-                            response += f"  Blocked: {stat.blocked_requests}\n"
-                        if stat.rate_limited_requests > 0:
-                            response += f"  Rate Limited: {stat.rate_limited_requests}\n"
-                        response += f"  Delay: {stat.current_delay:.1f}s\n"
-                        if stat.circuit_breaker_state != "closed":
-                            cb_icon = "🔴" if stat.circuit_breaker_state == "open" else "🟡"
-                            response += f"  {cb_icon} Circuit: {stat.circuit_breaker_state}\n"
+            # Most active feeds (by last notification)
+            feeds_with_notifications = [f for f in feeds if f.last_notified_at is not None]
+            if feeds_with_notifications:
+                sorted_feeds = sorted(
+                    feeds_with_notifications,
+                    key=lambda x: x.last_notified_at or datetime.min,
+                    reverse=True,
+                )[:5]
+
+                response += "🏆 <b>Most Active Feeds</b>\n"
+                for feed in sorted_feeds:
+                    status_emoji = "✅" if feed.enabled else "❌"
+                    last_notified = format_time_ago(feed.last_notified_at)
+                    response += f"{status_emoji} <b>{feed.name}</b>\n"
+                    response += f"   ⏰ Last notified: {last_notified}\n"
+                    if feed.failures > 0:
+                        response += f"   ⚠️ Failures: {feed.failures}\n"
                     response += "\n"
 
-                # Circuit breaker summary
-                if summary["circuit_breaker_open"] > 0 or summary["circuit_breaker_half_open"] > 0:
-                    response += "<b>⚡ Circuit Breakers:</b>\n"
-                    if summary["circuit_breaker_open"] > 0:
-                        response += f"🔴 Open: {summary['circuit_breaker_open']}\n"
-                    if summary["circuit_breaker_half_open"] > 0:
-                        response += f"🟡 Testing: {summary['circuit_breaker_half_open']}\n"
+            # Recent activity section
+            response += "🔄 <b>Recent Activity</b>\n"
+            feeds_with_checks = [f for f in feeds if f.last_check is not None]
+            if feeds_with_checks:
+                sorted_by_check = sorted(
+                    feeds_with_checks,
+                    key=lambda x: x.last_check or datetime.min,
+                    reverse=True,
+                )[:5]
+
+                for feed in sorted_by_check:
+                    status_emoji = "✅" if feed.enabled else "❌"
+                    last_check = format_time_ago(feed.last_check)
+                    last_notified = format_time_ago(feed.last_notified_at)
+                    response += f"{status_emoji} <b>{feed.name}</b>\n"
+                    response += f"   🔍 Last check: {last_check}\n"
+                    response += f"   📨 Last notified: {last_notified}\n"
+                    if feed.failures > 0:
+                        response += f"   ⚠️ Failures: {feed.failures}\n"
                     response += "\n"
-
-                # Low success rate domains
-                low_success_domains = stats_service.get_domains_with_low_success_rate(
-                    threshold=50.0
-                )
-                if low_success_domains:
-                    response += "<b>⚠️ Low Success Rate Domains:</b>\n"
-                    for stat in low_success_domains[:5]:
-                        success_rate = (
-                            (stat.successful_requests / stat.total_requests * 100)
-                            if stat.total_requests > 0
-                            else 0.0
-                        )
-                        response += f"• {stat.domain}: {success_rate:.1f}%\n"
+            else:
+                response += "ℹ️ No recent activity yet.\n\n"
+
+            # Feed health section
+            feeds_with_issues = [f for f in feeds if f.failures > 0 or not f.enabled]
+            if feeds_with_issues:
+                response += "📈 <b>Feed Health</b>\n"
+                for feed in feeds_with_issues[:5]:
+                    status_emoji = "✅" if feed.enabled else "❌"
+                    health_emoji = "⚠️" if feed.failures > 0 else status_emoji
+                    response += f"{health_emoji} <b>{feed.name}</b>\n"
+                    if not feed.enabled:
+                        response += "   Status: Disabled\n"
+                    if feed.failures > 0:
+                        response += f"   ⚠️ Failures: {feed.failures}\n"
                     response += "\n"
 
-                if summary["total_requests"] == 0:
-                    response += "ℹ️ No blocking data yet.\n"
+            # Global statistics
+            bot_stats = await bot_service.get_stats()
+            if bot_stats.get("database"):
+                db_stats = bot_stats["database"]
+                response += "🌐 <b>Global Statistics</b>\n"
+                response += f"Total Feeds: {db_stats.get('total_feeds', 0)}\n"
+                response += f"Total Chats: {db_stats.get('total_chats', 0)}\n"
 
             await message.answer(response)
-        except Exception as e:
-            logger.error(f"Failed to get block stats: {e}")
-            await message.answer("❌ Failed to get statistics. Please try again.")
-
-    # Stats command
-    @dp.message(Command("stats"))
-    async def stats_command(message: Message):
-        """Show bot statistics"""
-        chat_id = str(message.chat.id)
-
-        try:
-            from app.database import database
-            from app.bot import bot_service
-            from datetime import datetime
-
-            with database.get_session() as session:
-                from sqlmodel import select
-                from app.models.feed import Feed
-
-                feeds = session.exec(select(Feed).where(Feed.chat_id == chat_id)).all()
-                enabled_feeds = [f for f in feeds if f.enabled]
-                disabled_feeds = [f for f in feeds if not f.enabled]
-
-                # Helper function to format time ago
-                def format_time_ago(dt: Optional[datetime]) -> str:
-                    if not dt:
-                        return "never"
-                    now = datetime.utcnow()
-                    diff = now - dt
-                    if diff.total_seconds() < 60:
-                        return f"{int(diff.total_seconds())}s ago"
-                    elif diff.total_seconds() < 3600:
-                        return f"{int(diff.total_seconds() / 60)}m ago"
-                    elif diff.total_seconds() < 86400:
-                        return f"{int(diff.total_seconds() / 3600)}h ago"
-                    else:
-                        return f"{int(diff.total_seconds() / 86400)}d ago"
-
-                # Build response with emojis
-                response = "📊 <b>Bot Statistics</b>\n\n"
-
-                # Feed overview
-                response += "📋 <b>Your Feeds Overview</b>\n"
-                response += f"✅ Enabled: {len(enabled_feeds)} | ❌ Disabled: {len(disabled_feeds)} | 📊 Total: {len(feeds)}\n\n"
-
-                if not feeds:
-                    response += "ℹ️ No feeds configured yet. Use /add to add a feed.\n"
-                    await message.answer(response)
-                    return
-
-                # Most active feeds (by last notification)
-                feeds_with_notifications = [f for f in feeds if f.last_notified_at is not None]
-                if feeds_with_notifications:
-                    sorted_feeds = sorted(
-                        feeds_with_notifications,
-                        key=lambda x: x.last_notified_at or datetime.min,
-                        reverse=True,
-                    )[:5]
-
-                    response += "🏆 <b>Most Active Feeds</b>\n"
-                    for feed in sorted_feeds:
-                        status_emoji = "✅" if feed.enabled else "❌"
-                        last_notified = format_time_ago(feed.last_notified_at)
-                        response += f"{status_emoji} <b>{feed.name}</b>\n"
-                        response += f"   ⏰ Last notified: {last_notified}\n"
-                        if feed.failures > 0:
-                            response += f"   ⚠️ Failures: {feed.failures}\n"
-                        response += "\n"
-
-                # Recent activity section
-                response += "🔄 <b>Recent Activity</b>\n"
-                feeds_with_checks = [f for f in feeds if f.last_check is not None]
-                if feeds_with_checks:
-                    sorted_by_check = sorted(
-                        feeds_with_checks,
-                        key=lambda x: x.last_check or datetime.min,
-                        reverse=True,
-                    )[:5]
-
-                    for feed in sorted_by_check:
-                        status_emoji = "✅" if feed.enabled else "❌"
-                        last_check = format_time_ago(feed.last_check)
-                        last_notified = format_time_ago(feed.last_notified_at)
-                        response += f"{status_emoji} <b>{feed.name}</b>\n"
-                        response += f"   🔍 Last check: {last_check}\n"
-                        response += f"   📨 Last notified: {last_notified}\n"
-                        if feed.failures > 0:
-                            response += f"   ⚠️ Failures: {feed.failures}\n"
-                        response += "\n"
-                else:
-                    response += "ℹ️ No recent activity yet.\n\n"
-
-                # Feed health section
-                feeds_with_issues = [f for f in feeds if f.failures > 0 or not f.enabled]
-                if feeds_with_issues:
-                    response += "📈 <b>Feed Health</b>\n"
-                    for feed in feeds_with_issues[:5]:
-                        status_emoji = "✅" if feed.enabled else "❌"
-                        health_emoji = "⚠️" if feed.failures > 0 else status_emoji
-                        response += f"{health_emoji} <b>{feed.name}</b>\n"
-                        if not feed.enabled:
-                            response += "   Status: Disabled\n"
-                        if feed.failures > 0:
-                            response += f"   ⚠️ Failures: {feed.failures}\n"
-                        response += "\n"
-
-                # Global statistics
-                bot_stats = await bot_service.get_stats()
-                if bot_stats.get("database"):
-                    db_stats = bot_stats["database"]
-                    response += "🌐 <b>Global Statistics</b>\n"
-                    response += f"Total Feeds: {db_stats.get('total_feeds', 0)}\n"
-                    response += f"Total Chats: {db_stats.get('total_chats', 0)}\n"
+    except Exception as e:
+        logger.error(f"Failed to get stats: {e}")
+        await message.answer("❌ Failed to get statistics. Please try again.")
+
+
+# Command name -> handler, looked up by _route_command for every feed command
+_COMMAND_HANDLERS = {
+    "list": list_feeds_command,
+    "add": partial(
+        _run_feed_op,
+        op_name="add",
+        arg_count=2,
+        usage=ADD_USAGE,
+        service_fn=feed_service.add_feed,
+        success_fmt="✅ <b>Feed added successfully!</b>\n\nName: <b>{0}</b>\nURL: {1}",
+        default_error="Unknown error",
+    ),
+    "remove": partial(
+        _run_feed_op,
+        op_name="remove",
+        arg_count=1,
+        usage=REMOVE_USAGE,
+        service_fn=feed_service.remove_feed,
+        success_fmt="✅ <b>Feed removed:</b> {0}",
+    ),
+    "enable": partial(
+        _run_feed_op,
+        op_name="enable",
+        arg_count=1,
+        usage=ENABLE_USAGE,
+        service_fn=feed_service.enable_feed,
+        success_fmt="✅ <b>Feed enabled:</b> {0}",
+    ),
+    "disable": partial(
+        _run_feed_op,
+        op_name="disable",
+        arg_count=1,
+        usage=DISABLE_USAGE,
+        service_fn=feed_service.disable_feed,
+        success_fmt="❌ <b>Feed disabled:</b> {0}",
+    ),
+    "health": health_command,
+    "blockstats": blockstats_command,
+    "stats": stats_command,
+}
+
+
+async def _route_command(message: Message, command: CommandObject):
+    """Dispatch a feed command to its handler by name"""
+    await _COMMAND_HANDLERS[command.command](message, command)
 
-                await message.answer(response)
-        except Exception as e:
-            logger.error(f"Failed to get stats: {e}")
-            await message.answer("❌ Failed to get statistics. Please try again.")
+
+async def setup_feed_commands(dp: Optional[Dispatcher], bot: Optional[Bot]):
+    """Setup feed management commands"""
+    if not dp:
+        return
+
+    # One filter for all feed commands instead of one registered handler per command
+    dp.message.register(_route_command, Command(*_COMMAND_HANDLERS))
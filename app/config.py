@@ -1,11 +1,14 @@
 """Configuration management using pydantic-settings"""
 
-import os
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, model_validator
 from typing import Optional
 
 
+# Default log level per environment, used when LOG_LEVEL is not set
+ENVIRONMENT_LOG_LEVELS = {"production": "info"}
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables"""
 
@@ -23,6 +26,17 @@ class Settings(BaseSettings):
     port: int = 8916
     host: str = "0.0.0.0"
 
+    # Telegram Webhook Configuration (polling is used when disabled)
+    use_webhook: bool = False
+    webhook_url: Optional[str] = None  # Public base URL Telegram should call
+    webhook_path: str = "/telegram/webhook"
+    webhook_secret: Optional[str] = None
+    webhook_host: str = "0.0.0.0"
+    webhook_port: int = 8443
+
+    # Long-polling Configuration (seconds Telegram holds each getUpdates open)
+    polling_timeout: int = 30
+
     # Database Configuration
     database_url: str = "sqlite:///./data/development.db"  # Default for development
 
@@ -50,14 +64,9 @@ class Settings(BaseSettings):
     @model_validator(mode="after")
     def set_environment_defaults(self) -> "Settings":
         """Set environment-specific defaults for log level"""
-        if self.environment == "production":
-            # Production defaults
-            if self.log_level == "debug":
-                # Keep debug if explicitly set
-                pass
-            elif not os.getenv("LOG_LEVEL"):
-                # Default to info in production if not explicitly set
-                self.log_level = "info"
+        # An explicitly configured LOG_LEVEL (env or .env) always wins
+        if "log_level" not in self.model_fields_set:
+            self.log_level = ENVIRONMENT_LOG_LEVELS.get(self.environment, self.log_level)
 
         return self
 
@@ -75,38 +84,13 @@ class Settings(BaseSettings):
     # Feature Flags
     feature_instagram: bool = False
 
-    # Resilience System Configuration
-    telegram_resilience_enabled: bool = True
-    telegram_max_retries: int = 10
-    telegram_base_delay: int = 1000
-    telegram_max_delay: int = 60000
-    telegram_circuit_breaker_threshold: int = 5
-    telegram_circuit_breaker_timeout: int = 300000
-
-    # Message Queue Configuration
-    message_queue_enabled: bool = True
-    message_queue_max_size: int = 1000
-    message_queue_batch_size: int = 20
-    message_queue_processing_interval: int = 5000
-    message_queue_message_ttl: int = 3600000
-
-    # Health Monitoring Configuration
-    health_check_interval: int = 30000
-    alert_threshold_error_rate: float = 0.1
-    alert_threshold_downtime_minutes: int = 15
-    alert_threshold_queue_size: int = 500
-
-    # Job Cleanup Configuration
-    job_cleanup_enabled: bool = True
-    job_cleanup_interval_minutes: int = 30
-    job_cleanup_thorough_interval_hours: int = 2
-    job_cleanup_orphaned_threshold: int = 10
-
     # Advanced Settings
     max_feeds_per_chat: int = 50
     cache_ttl_minutes: int = 20
     circuit_breaker_threshold: int = 3
     min_delay_ms: int = 200000
+    last_check_flush_interval: int = 60  # seconds unchanged feeds' last_check stays in memory
+    feed_checks_per_minute: int = 60  # feed fetches started per minute across all feeds
 
     # Anti-blocking Configuration
     anti_block_enabled: bool = True
@@ -2,8 +2,11 @@
 
 from typing import Dict, Any, Optional
 from sqlmodel import SQLModel, create_engine, Session, select
+from sqlalchemy import event, func
 from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
 import os
+import re
 
 from app.config import settings
 from app.utils.logger import get_logger
@@ -14,6 +17,84 @@ from app.models.feed import (
 
 logger = get_logger(__name__)
 
+# Prisma-style "file:" URLs and SQLAlchemy "sqlite:///" URLs, split into prefix and path
+_SQLITE_URL_RE = re.compile(r"^(file:|sqlite:///\./|sqlite:///)(.*)$", re.DOTALL)
+_BACKSLASH_TO_SLASH = str.maketrans("\\", "/")
+
+
+def _docker_path_to_relative(path: str) -> str:
+    """Map a Unix/Docker absolute path to a path relative to the working directory"""
+    if "/app/" in path:
+        return "./" + path.split("/app/")[-1]
+    return "./data/" + os.path.basename(path)
+
+
+def _ensure_dir(path: str) -> None:
+    """Create the parent directory of path if it doesn't exist"""
+    db_dir = os.path.dirname(path)
+    if not db_dir:
+        return
+    # Attempt the mkdir directly instead of stat-ing first
+    try:
+        os.makedirs(db_dir)
+    except FileExistsError:
+        return
+    logger.info("Created database directory: %s", db_dir)
+
+
+def _normalize_sqlite_url(raw: str) -> str:
+    """Convert file:/sqlite:/// URLs to a SQLAlchemy URL and create the database directory
+
+    Non-SQLite URLs are returned unchanged.
+    """
+    match = _SQLITE_URL_RE.match(raw)
+    if not match:
+        return raw
+
+    prefix, path = match.groups()
+    if prefix == "file:":
+        # Prisma format: file:/app/data/production.db or file:./data/development.db
+        # Only fix paths on Windows (keep Docker/Unix paths as-is)
+        if os.name == "nt" and path.startswith("/"):
+            path = _docker_path_to_relative(path)
+    elif prefix == "sqlite:///":
+        # Absolute or relative: sqlite:///data/development.db
+        if path.startswith("/app/") or (path.startswith("/") and os.name == "nt"):
+            path = _docker_path_to_relative(path)
+    # "sqlite:///./" (relative path) needs no rewriting
+
+    # Normalize path separators for Windows
+    if os.name == "nt":
+        path = path.replace("/", os.sep)
+
+    _ensure_dir(path)
+
+    # Convert to SQLAlchemy format (always use forward slashes for SQLite URLs)
+    return f"sqlite:///{path.translate(_BACKSLASH_TO_SLASH)}"
+
+
+# Applied to every new SQLite connection: WAL lets readers run alongside the writer and,
+# with synchronous=NORMAL, avoids an fsync on every commit
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    # Page cache of up to 64 MiB (negative values are KiB) instead of SQLite's 2 MiB default
+    "PRAGMA cache_size=-64000",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune a freshly opened SQLite connection"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 
 class DatabaseService:
     """Database service for managing SQLModel database"""
@@ -21,81 +102,18 @@ class DatabaseService:
     def __init__(self):
         self.engine: Optional[Engine] = None
         self._session: Optional[Session] = None
+        self._session_factory: Optional[sessionmaker] = None
 
     def initialize(self):
         """Initialize database connection"""
         try:
             # Convert SQLite URL format
             database_url = settings.database_url
-            logger.info(f"Raw database URL from settings: {database_url}")
-
-            # Handle different URL formats
-            if database_url.startswith("file:"):
-                # Prisma format: file:/app/data/production.db or file:./data/development.db
-                path = database_url.replace("file:", "")
-
-                # Only fix paths on Windows (keep Docker/Unix paths as-is)
-                if os.name == "nt" and path.startswith("/"):  # Windows
-                    # Unix absolute path on Windows, convert to relative
-                    if "/app/" in path:
-                        # Docker path on Windows, convert to relative
-                        path = "./" + path.split("/app/")[-1]
-                    else:
-                        # Generic absolute path, use just the filename in data directory
-                        path = "./data/" + os.path.basename(path)
-                    # Normalize path separators for Windows
-                    path = path.replace("/", os.sep)
-
-                # Create directory if it doesn't exist
-                db_dir = os.path.dirname(path)
-                if db_dir and not os.path.exists(db_dir):
-                    os.makedirs(db_dir, exist_ok=True)
-                    logger.info(f"Created database directory: {db_dir}")
-
-                # Convert to SQLAlchemy format (always use forward slashes for SQLite URLs)
-                normalized_path = path.replace("\\", "/")
-                database_url = f"sqlite:///{normalized_path}"
-
-            elif database_url.startswith("sqlite:///./"):
-                # Relative path: sqlite:///./data/development.db
-                path = database_url.replace("sqlite:///./", "")
-                # Normalize path separators for Windows
-                if os.name == "nt":
-                    path = path.replace("/", os.sep)
-                db_dir = os.path.dirname(path)
-                if db_dir and not os.path.exists(db_dir):
-                    os.makedirs(db_dir, exist_ok=True)
-                    logger.info(f"Created database directory: {db_dir}")
-                # Normalize for SQLite URL
-                normalized_path = path.replace("\\", "/")
-                database_url = f"sqlite:///{normalized_path}"
-            elif database_url.startswith("sqlite:///"):
-                # Absolute or relative: sqlite:///data/development.db
-                path = database_url.replace("sqlite:///", "")
-
-                # Handle absolute paths that don't exist on Windows
-                if path.startswith("/app/") or (path.startswith("/") and os.name == "nt"):
-                    # Convert Unix/Docker absolute paths to relative on Windows
-                    if "/app/" in path:
-                        path = "./" + path.split("/app/")[-1]
-                    else:
-                        path = "./data/" + os.path.basename(path)
-
-                # Normalize path separators for Windows
-                if os.name == "nt":
-                    path = path.replace("/", os.sep)
-
-                # Create directory if it doesn't exist
-                db_dir = os.path.dirname(path)
-                if db_dir and not os.path.exists(db_dir):
-                    os.makedirs(db_dir, exist_ok=True)
-                    logger.info(f"Created database directory: {db_dir}")
-
-                # Normalize for SQLite URL
-                normalized_path = path.replace("\\", "/")
-                database_url = f"sqlite:///{normalized_path}"
-
-            logger.info(f"Connecting to database: {database_url.split('/')[-1]}")
+            logger.info("Raw database URL from settings: %s", database_url)
+
+            database_url = _normalize_sqlite_url(database_url)
+
+            logger.info("Connecting to database: %s", database_url.rpartition("/")[2])
 
             # Create engine with SQLite-specific settings
             if database_url.startswith("sqlite:///"):
@@ -105,68 +123,78 @@ class DatabaseService:
                     connect_args=connect_args,
                     echo=False,
                 )
+                event.listen(self.engine, "connect", _apply_sqlite_pragmas)
             else:
                 self.engine = create_engine(database_url, echo=False)
 
+            # Sessions keep loaded attributes after commit so results can be used once closed
+            self._session_factory = sessionmaker(
+                bind=self.engine, class_=Session, expire_on_commit=False
+            )
+
             # Create tables
             SQLModel.metadata.create_all(self.engine)
 
             logger.info("Database initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize database: {e}")
+            logger.error("Failed to initialize database: %s", e)
             raise
 
     def get_session(self) -> Session:
         """Get database session"""
-        if not self.engine:
+        if not self._session_factory:
             raise RuntimeError("Database not initialized. Call initialize() first.")
-        return Session(self.engine)
+        return self._session_factory()
 
     async def health_check(self) -> bool:
         """Check database health"""
         try:
-            with self.get_session() as session:
-                # Simple query to check connection
-                session.exec(select(1)).first()
+            if not self.engine:
+                raise RuntimeError("Database not initialized. Call initialize() first.")
+            # Driver-level ping; no ORM session needed just to check connectivity
+            with self.engine.connect() as conn:
+                conn.exec_driver_sql("SELECT 1")
                 return True
         except Exception as e:
-            logger.error(f"Database health check failed: {e}")
+            logger.error("Database health check failed: %s", e)
             return False
 
     async def get_metrics(self) -> Dict[str, Any]:
         """Get database metrics"""
         try:
             with self.get_session() as session:
-                feed_count = session.exec(select(Feed)).all()
-                chat_count = session.exec(select(Chat)).all()
+                feed_count = session.exec(select(func.count()).select_from(Feed)).one()
+                chat_count = session.exec(select(func.count()).select_from(Chat)).one()
 
                 return {
-                    "database_feed_count": len(feed_count),
-                    "database_chat_count": len(chat_count),
+                    "database_feed_count": feed_count,
+                    "database_chat_count": chat_count,
                 }
         except Exception as e:
-            logger.error(f"Failed to get database metrics: {e}")
+            logger.error("Failed to get database metrics: %s", e)
             return {}
 
     async def get_stats(self) -> Dict[str, Any]:
         """Get database statistics"""
         try:
             with self.get_session() as session:
-                feeds = session.exec(select(Feed)).all()
-                chats = session.exec(select(Chat)).all()
-                enabled_feeds = [f for f in feeds if f.enabled]
-                disabled_feeds = [f for f in feeds if not f.enabled]
+                feed_counts = dict(
+                    session.exec(select(Feed.enabled, func.count()).group_by(Feed.enabled)).all()
+                )
+                chat_count = session.exec(select(func.count()).select_from(Chat)).one()
+                enabled_feeds = feed_counts.get(True, 0)
+                disabled_feeds = feed_counts.get(False, 0)
 
                 return {
                     "database": {
-                        "total_feeds": len(feeds),
-                        "enabled_feeds": len(enabled_feeds),
-                        "disabled_feeds": len(disabled_feeds),
-                        "total_chats": len(chats),
+                        "total_feeds": enabled_feeds + disabled_feeds,
+                        "enabled_feeds": enabled_feeds,
+                        "disabled_feeds": disabled_feeds,
+                        "total_chats": chat_count,
                     }
                 }
         except Exception as e:
-            logger.error(f"Failed to get database stats: {e}")
+            logger.error("Failed to get database stats: %s", e)
             return {"database": {}}
 
     def close(self):
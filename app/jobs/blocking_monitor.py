@@ -1,5 +1,8 @@
 """Blocking monitor job for periodic success rate checks"""
 
+import asyncio
+import sys
+
 from app.database import database
 from app.services.blocking_stats_service import BlockingStatsService
 from app.services.blocking_alert_service import blocking_alert_service
@@ -9,6 +12,9 @@ from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Settings are fixed for the process lifetime; bind the alert target once
+_ADMIN_CHAT_ID = settings.allowed_user_id
+
 
 class BlockingMonitor:
     """Monitor blocking statistics and send alerts"""
@@ -18,40 +24,61 @@ class BlockingMonitor:
         try:
             logger.debug("🔍 Checking domain success rates...")
 
+            # Copy the rows into plain tuples so the session is closed before any network I/O
             with database.get_session() as session:
                 stats_service = BlockingStatsService(session)
 
-                # Get domains with low success rate (below 50%)
-                low_success_domains = stats_service.get_domains_with_low_success_rate(
-                    threshold=50.0
-                )
-
-                if not low_success_domains:
-                    logger.debug("✅ All domains have acceptable success rates")
-                    return
-
-                logger.info(f"⚠️ Found {len(low_success_domains)} domain(s) with low success rates")
-
-                # Send alerts for each low success rate domain
-                admin_chat_id = settings.allowed_user_id
-                if bot_service.bot and admin_chat_id:
-                    for stats in low_success_domains:
-                        success_rate = (
-                            (stats.successful_requests / stats.total_requests * 100)
-                            if stats.total_requests > 0
-                            else 0.0
-                        )
-
-                        await blocking_alert_service.check_and_alert_low_success_rate(
-                            domain=stats.domain,
+                # Get domains with low success rate (below 50%); domains are interned because
+                # the alert service keys its cooldown dicts by them on every tick
+                low_success_domains = [
+                    (sys.intern(domain), total_requests, success_rate)
+                    for domain, total_requests, success_rate in stats_service.get_low_success_rates(
+                        threshold=50.0
+                    )
+                ]
+
+            if not low_success_domains:
+                logger.debug("✅ All domains have acceptable success rates")
+                return
+
+            logger.info("⚠️ Found %d domain(s) with low success rates", len(low_success_domains))
+
+            # Send alerts for each low success rate domain
+            admin_chat_id = _ADMIN_CHAT_ID
+            if bot_service.bot and admin_chat_id:
+                # Alerts run concurrently; bot_service's send queue enforces Telegram limits
+                results = await asyncio.gather(
+                    *(
+                        blocking_alert_service.check_and_alert_low_success_rate(
+                            domain=domain,
                             success_rate=success_rate,
-                            total_requests=stats.total_requests,
+                            total_requests=total_requests,
                             bot_service=bot_service,
                             admin_chat_id=admin_chat_id,
                         )
+                        for domain, total_requests, success_rate in low_success_domains
+                    ),
+                    return_exceptions=True,
+                )
+                for (domain, _, _), result in zip(low_success_domains, results):
+                    if isinstance(result, Exception):
+                        logger.error(
+                            "❌ Failed to alert on low success rate for %s: %s",
+                            domain,
+                            result,
+                            exc_info=result,
+                        )
+
+        except Exception as e:
+            logger.error("❌ Failed to check success rates: %s", e, exc_info=True)
 
+    def flush_success_stats(self):
+        """Write request successes buffered since the last flush"""
+        try:
+            with database.get_session() as session:
+                BlockingStatsService(session).flush_pending_successes()
         except Exception as e:
-            logger.error(f"❌ Failed to check success rates: {e}", exc_info=True)
+            logger.error("❌ Failed to flush blocking statistics: %s", e, exc_info=True)
 
     async def cleanup_old_stats(self):
         """Clean up old statistics (older than 7 days)"""
@@ -63,12 +90,12 @@ class BlockingMonitor:
                 reset_count = stats_service.reset_old_stats(days=7)
 
                 if reset_count > 0:
-                    logger.info(f"🧹 Reset {reset_count} old blocking statistics")
+                    logger.info("🧹 Reset %d old blocking statistics", reset_count)
                 else:
                     logger.debug("✅ No old statistics to clean up")
 
         except Exception as e:
-            logger.error(f"❌ Failed to cleanup old stats: {e}", exc_info=True)
+            logger.error("❌ Failed to cleanup old stats: %s", e, exc_info=True)
 
 
 # Global blocking monitor instance
@@ -76,14 +103,19 @@ blocking_monitor = BlockingMonitor()
 
 
 async def check_blocking_stats_job():
-    """APScheduler job function to check blocking statistics"""
+    """Job function to check blocking statistics"""
     logger.debug("🔄 Blocking monitor job started")
     await blocking_monitor.check_success_rates()
     logger.debug("✅ Blocking monitor job completed")
 
 
+async def flush_blocking_stats_job():
+    """Job function to write buffered request successes"""
+    blocking_monitor.flush_success_stats()
+
+
 async def cleanup_blocking_stats_job():
-    """APScheduler job function to cleanup old blocking statistics"""
+    """Scheduler job function to cleanup old blocking statistics"""
     logger.debug("🔄 Blocking stats cleanup job started")
     await blocking_monitor.cleanup_old_stats()
     logger.debug("✅ Blocking stats cleanup job completed")
@@ -1,53 +1,306 @@
-"""Feed checker job using APScheduler"""
+"""Feed checker job"""
 
-from datetime import datetime
-from typing import Dict, Any, Optional
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlparse
+
+from aiolimiter import AsyncLimiter
 
 from app.models.feed import Feed
 from app.services.rss_service import rss_service
 from app.services.feed_service import feed_service
 from app.bot import bot_service
+from app.utils.cache import cache_service
+from app.config import settings
+from app.utils.html_sanitizer import (
+    is_valid_telegram_html,
+    sanitize_html_for_telegram,
+    strip_html_tags,
+)
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Feeds checked at once (the overall fetch rate is settings.feed_checks_per_minute)
+MAX_CONCURRENT_FEED_CHECKS = 5
+# Feeds from the same host checked at once, so one origin isn't hit with the whole batch
+MAX_CONCURRENT_CHECKS_PER_HOST = 2
+
+# Seconds to send a feed's notifications as plain text after its HTML was rejected
+HTML_RETRY_INTERVAL = 3600
+
+# Bounds on the wait between check cycles (seconds): the minimum keeps failing feeds (whose
+# last_check isn't advanced) from being retried in a tight loop, the maximum picks up
+# schedule changes made outside this process
+MIN_CYCLE_INTERVAL = 60
+MAX_CYCLE_INTERVAL = 300
+
+# Seconds a notified item id is remembered in Redis, so re-ordered or re-published items
+# that pass the date check again are not sent twice
+SEEN_ITEM_TTL = 7 * 24 * 3600
+# Notified item ids also remembered in memory per feed, so repeats are dropped without a
+# Redis round trip (and still dropped while Redis is unavailable)
+MAX_SEEN_ITEMS_PER_FEED = 500
+
+# Failed feed names listed in the cycle summary; the rest are only counted
+MAX_LOGGED_ERROR_FEEDS = 20
+
+# Feed names and item fields repeat across items, chats subscribed to the same feed and
+# later cycles, so sanitized results are memoized instead of rescanned each time
+_sanitize_html = lru_cache(maxsize=1024)(sanitize_html_for_telegram)
+_strip_html = lru_cache(maxsize=1024)(strip_html_tags)
+
+# Maximum description length in notifications
+MAX_DESCRIPTION_LENGTH = 500
+
+
+def _truncate(text: str, limit: int = MAX_DESCRIPTION_LENGTH) -> str:
+    """Cut text to limit characters, marking the cut with an ellipsis"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _format_pub_date(item) -> str:
+    """Format an item's publication date for notifications"""
+    return item.pub_date.strftime("%Y-%m-%d %H:%M:%S UTC") if item.pub_date else ""
+
+
+def _format_html(item, feed_name: str, pub_date: str) -> str:
+    """Format RSS item as a Telegram HTML message (feed_name must already be sanitized)"""
+    # Sanitize HTML for Telegram; limit description length after cleaning
+    description = _sanitize_html(item.description) if item.description else ""
+    return "".join(
+        (
+            f"📰 <b>{feed_name}</b>\n\n",
+            f"<b>{_sanitize_html(item.title or 'No title')}</b>\n\n",
+            f"{_truncate(description)}\n\n" if description else "",
+            f"🕐 {pub_date}\n\n" if pub_date else "",
+            f"🔗 <a href='{_sanitize_html(item.link)}'>Read more</a>" if item.link else "",
+        )
+    )
+
+
+def _format_plain(item, feed_name: str, pub_date: str) -> str:
+    """Format RSS item as a plain text message (feed_name must already be stripped)"""
+    description = _strip_html(item.description) if item.description else ""
+    return "".join(
+        (
+            f"📰 {feed_name}\n\n",
+            f"{_strip_html(item.title or 'No title')}\n\n",
+            f"{_truncate(description)}\n\n" if description else "",
+            f"🕐 {pub_date}\n\n" if pub_date else "",
+            f"🔗 {item.link}" if item.link else "",
+        )
+    )
+
+
+@dataclass(slots=True)
+class CycleStats:
+    """Counters for one check_all_feeds cycle"""
+
+    checked: int = 0
+    errors: int = 0
+    notifications: int = 0
+    error_feeds: List[str] = field(default_factory=list)
+    error_feeds_overflow: int = 0
+
 
 class FeedChecker:
     """Feed checker that processes feeds and sends notifications"""
 
-    def _should_check_feed(self, feed: Feed) -> bool:
-        """Check if feed should be checked based on interval"""
-        if not feed.last_check:
-            return True
+    def __init__(self):
+        self._check_semaphore = asyncio.Semaphore(MAX_CONCURRENT_FEED_CHECKS)
+        self._check_limiter = AsyncLimiter(settings.feed_checks_per_minute, 60)
+        # host -> semaphore and the checks holding or waiting for it; dropped when that count
+        # reaches zero so hosts of removed feeds don't stay for the life of the process
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._host_users: Dict[str, int] = {}
+        # feed_id -> monotonic time until which notifications go straight to plain text
+        self._html_disabled_until: Dict[str, float] = {}
+        # feed_id -> last_check not yet written, for feeds whose check changed nothing else
+        self._pending_last_check: Dict[str, datetime] = {}
+        # feed_id -> item state update (last_item_id/last_notified_at) whose write failed;
+        # checks read it instead of the stale stored values until a retry succeeds
+        self._pending_item_updates: Dict[str, Dict[str, Any]] = {}
+        # feed_id -> {item_id: monotonic expiry}, in insertion order; exact, so a hit is
+        # always a real repeat
+        self._seen_items: Dict[str, Dict[str, float]] = defaultdict(dict)
+        self._flush_task: Optional[asyncio.Task] = None
+        self._run_task: Optional[asyncio.Task] = None
+
+    async def _drop_seen_items(self, feed: Feed, items: List[Any]) -> List[Any]:
+        """Filter out items already notified for feed, checking memory before Redis"""
+        seen = self._seen_items[feed.id]
+        now = time.monotonic()
+        candidates = [item for item in items if seen.get(item.id, 0.0) <= now]
+
+        unseen = []
+        if candidates:
+            # One pipelined SET NX for the ids this process hasn't notified recently
+            is_new = await cache_service.add_many(
+                [f"item:{feed.id}:{item.id}" for item in candidates], SEEN_ITEM_TTL
+            )
+            unseen = [item for item, new in zip(candidates, is_new) if new]
+
+            expires = now + SEEN_ITEM_TTL
+            for item in candidates:
+                seen.pop(item.id, None)
+                seen[item.id] = expires
+            if len(seen) > MAX_SEEN_ITEMS_PER_FEED:
+                # Oldest entries first; Redis still covers anything dropped here
+                for item_id in list(seen)[: len(seen) - MAX_SEEN_ITEMS_PER_FEED]:
+                    del seen[item_id]
+
+        if len(unseen) < len(items):
+            logger.debug(
+                "Skipping %d already notified item(s) of %s", len(items) - len(unseen), feed.name
+            )
+        return unseen
 
-        time_since_last_check = (datetime.utcnow() - feed.last_check).total_seconds() / 60
-        return time_since_last_check >= feed.check_interval_minutes
+    def _record_error_feed(self, stats: CycleStats, name: str):
+        """Remember a failed feed name for the summary, keeping the list bounded"""
+        if len(stats.error_feeds) < MAX_LOGGED_ERROR_FEEDS:
+            stats.error_feeds.append(name)
+        else:
+            stats.error_feeds_overflow += 1
 
-    def _log_summary(self, stats: dict):
+    def _log_summary(self, stats: CycleStats):
         """Log summary of check cycle"""
-        if stats["checked"] == 0:
-            logger.debug(f"ℹ️ All {stats['total']} feed(s) skipped - intervals not reached")
-            return
-
         summary_parts = [
             "✅ Feed check complete:",
-            f"{stats['checked']} checked",
-            f"{stats['skipped']} skipped",
-            f"{stats['notifications']} notification(s) sent",
+            f"{stats.checked} checked",
+            f"{stats.notifications} notification(s) sent",
         ]
 
-        if stats["errors"] > 0:
-            summary_parts.append(f"{stats['errors']} error(s)")
+        if stats.errors > 0:
+            summary_parts.append(f"{stats.errors} error(s)")
             logger.warning(" | ".join(summary_parts))
-            if stats["error_feeds"]:
-                logger.warning(f"Failed feeds: {', '.join(stats['error_feeds'])}")
+            if stats.error_feeds:
+                overflow = stats.error_feeds_overflow
+                logger.warning(
+                    "Failed feeds: %s%s",
+                    ", ".join(stats.error_feeds),
+                    f" (+{overflow} more)" if overflow else "",
+                )
         else:
             logger.info(" | ".join(summary_parts))
 
+    def _is_due(self, feed: Feed, now: datetime) -> bool:
+        """Check a feed's interval against its last check time still waiting to be flushed"""
+        pending = self._pending_last_check.get(feed.id)
+        if pending is None and feed.id in self._pending_item_updates:
+            pending = self._pending_item_updates[feed.id]["last_check"]
+        return pending is None or now - pending >= timedelta(minutes=feed.check_interval_minutes)
+
+    def _ensure_flush_task(self):
+        """Start the periodic last_check flush if it isn't running"""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self):
+        """Write pending last_check times every last_check_flush_interval seconds"""
+        while True:
+            await asyncio.sleep(settings.last_check_flush_interval)
+            await self.flush_last_checks()
+
+    async def flush_last_checks(self):
+        """Write all pending last_check times in one bulk update, keeping any that fail"""
+        await self._write_item_updates([])
+        if not self._pending_last_check:
+            return
+        pending, self._pending_last_check = self._pending_last_check, {}
+        failed = await feed_service.bulk_bump_last_check(pending)
+        # Put failed bumps back for the next flush (and for _is_due); a newer time recorded
+        # while the write was in flight wins
+        for feed_id, checked_at in failed.items():
+            self._pending_last_check.setdefault(feed_id, checked_at)
+
+    async def _write_item_updates(self, updates: List[Dict[str, Any]]):
+        """Write item state updates together with any queued from failed writes
+
+        Updates that still can't be written are queued for the next cycle or flush.
+        """
+        # A newer update for the same feed supersedes the queued one, keeping its
+        # last_notified_at when the newer check didn't set one
+        merged, self._pending_item_updates = self._pending_item_updates, {}
+        for update in updates:
+            queued = merged.get(update["id"])
+            if queued is not None and not update["last_notified_at"]:
+                update = {**update, "last_notified_at": queued["last_notified_at"]}
+            merged[update["id"]] = update
+
+        if not merged:
+            return
+        failed = await feed_service.bulk_update_last_check(list(merged.values()))
+        for update in failed:
+            # Keep an update queued by a check that ran while this write was in flight
+            self._pending_item_updates.setdefault(update["id"], update)
+        if failed:
+            logger.warning("Queued item state of %d feed(s) for retry", len(failed))
+
+    def start(self):
+        """Start checking feeds as they become due"""
+        if self._run_task is None or self._run_task.done():
+            self._run_task = asyncio.create_task(self._run())
+
+    async def _seconds_until_next_due(self) -> float:
+        """Seconds until the soonest enabled feed's check interval elapses"""
+        now = datetime.utcnow()
+        next_due: Optional[datetime] = None
+        for feed_id, last_check, interval_minutes in await feed_service.get_check_schedule():
+            checked_at = self._pending_last_check.get(feed_id) or last_check
+            if checked_at is None:
+                return 0.0
+            due = checked_at + timedelta(minutes=interval_minutes)
+            if next_due is None or due < next_due:
+                next_due = due
+
+        if next_due is None:
+            return MAX_CYCLE_INTERVAL
+        return max(0.0, (next_due - now).total_seconds())
+
+    async def _run(self):
+        """Run a check cycle, then sleep until the next feed is due or the feeds change"""
+        feeds_changed = feed_service.feeds_changed
+        while True:
+            # Cleared before the cycle so a change during it triggers the next one right away
+            feeds_changed.clear()
+            await self.check_all_feeds()
+
+            delay = min(
+                MAX_CYCLE_INTERVAL, max(MIN_CYCLE_INTERVAL, await self._seconds_until_next_due())
+            )
+            logger.debug("⏰ Next feed check in %.0fs", delay)
+            try:
+                await asyncio.wait_for(feeds_changed.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def close(self):
+        """Stop checking and flushing, and write whatever last_check is still pending"""
+        for task in (self._run_task, self._flush_task):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._run_task = None
+        self._flush_task = None
+        await self.flush_last_checks()
+
     async def check_feed(self, feed: Feed) -> Dict[str, Any]:
         """Check a single feed for new items"""
+        started = time.monotonic()
         try:
-            logger.debug(f"🔍 Checking feed: {feed.name} ({feed.url})")
+            # isoformat() arguments below are only computed when debug output is enabled
+            debug = logger.isEnabledFor(logging.DEBUG)
+            logger.debug("🔍 Checking feed: %s (%s)", feed.name, feed.url)
 
             # Get last item ID and date
             last_item_id = feed.last_item_id
@@ -56,37 +309,50 @@ class FeedChecker:
             if not last_item_date:
                 last_item_date = feed.last_seen_at
 
+            # Item state from an earlier check whose write failed is newer than the stored one
+            queued = self._pending_item_updates.get(feed.id)
+            if queued is not None:
+                last_item_id = queued["last_item_id"] or last_item_id
+                last_item_date = queued["last_notified_at"] or last_item_date
+
             # Log feed state before checking (debug level)
-            logger.debug(
-                f"📊 Feed state for {feed.name}: "
-                f"lastItemId={last_item_id or 'None'}, "
-                f"lastNotifiedAt={last_item_date.isoformat() if last_item_date else 'None'}, "
-                f"lastCheck={feed.last_check.isoformat() if feed.last_check else 'Never'}"
-            )
+            if debug:
+                logger.debug(
+                    "📊 Feed state for %s: lastItemId=%s, lastNotifiedAt=%s, lastCheck=%s",
+                    feed.name,
+                    last_item_id or "None",
+                    last_item_date.isoformat() if last_item_date else "None",
+                    feed.last_check.isoformat() if feed.last_check else "Never",
+                )
 
             # Log first time processing
             if not last_item_id:
                 logger.debug(
-                    f"📌 First time checking feed {feed.name} - will not notify old items, setting baseline"
+                    "📌 First time checking feed %s - will not notify old items, setting baseline",
+                    feed.name,
                 )
 
             # Get new items from RSS service
-            logger.debug(f"📡 Fetching new items from RSS service for {feed.name}...")
+            logger.debug("📡 Fetching new items from RSS service for %s...", feed.name)
             result = await rss_service.get_new_items(
-                feed.rss_url or feed.url,
+                feed.effective_url,
                 last_item_id=last_item_id,
                 last_item_date=last_item_date,
             )
+            # One clock read for the baseline fallbacks, last_check and the max-age cutoff
+            now = datetime.utcnow()
 
             new_items = result.get("items", [])
             total_items_count = result.get("totalItemsCount", 0)
             first_item_id = result.get("firstItemId")
 
             logger.debug(
-                f"📥 RSS service result for {feed.name}: "
-                f"{len(new_items)} new items found, "
-                f"{total_items_count} total items in feed, "
-                f"firstItemId={first_item_id or 'None'}"
+                "📥 RSS service result for %s: %d new items found, %d total items in feed, "
+                "firstItemId=%s",
+                feed.name,
+                len(new_items),
+                total_items_count,
+                first_item_id or "None",
             )
 
             # Determine new last item ID
@@ -100,147 +366,135 @@ class FeedChecker:
                 # Use the date of the most recent post in the feed as baseline, not current time
                 # This ensures we don't notify posts that existed before adding the feed,
                 # but we WILL notify posts created between adding the feed and first check
-                feed_data = await rss_service.fetch_feed(feed.rss_url or feed.url)
-                if feed_data.get("success") and feed_data.get("feed") and feed_data["feed"].items:
-                    # Get the most recent item's date as baseline
-                    most_recent_item = feed_data["feed"].items[
-                        0
-                    ]  # Items are already sorted by date descending
-                    if most_recent_item.pub_date:
-                        last_notified = most_recent_item.pub_date
+                last_notified = result.get("firstItemPubDate")
+                if last_notified:
+                    if debug:
                         logger.debug(
-                            f"🔍 First time processing {feed.name} - setting baseline to most recent post date: "
-                            f"{last_notified.isoformat()} (from post {most_recent_item.id})"
+                            "🔍 First time processing %s - setting baseline to most recent post date: "
+                            "%s (from post %s)",
+                            feed.name,
+                            last_notified.isoformat(),
+                            new_last_item_id,
                         )
-                    else:
-                        # Fallback to current time if no date
-                        last_notified = datetime.utcnow()
+                else:
+                    # Fallback to current time if no date
+                    last_notified = now
+                    if debug:
                         logger.debug(
-                            f"🔍 First time processing {feed.name} - post has no date, using current time as baseline: {last_notified.isoformat()}"
+                            "🔍 First time processing %s - post has no date, using current time as "
+                            "baseline: %s",
+                            feed.name,
+                            last_notified.isoformat(),
                         )
-                else:
-                    # Fallback to current time if feed fetch fails
-                    last_notified = datetime.utcnow()
-                    logger.debug(
-                        f"🔍 First time processing {feed.name} - could not fetch feed, using current time as baseline: {last_notified.isoformat()}"
-                    )
             elif new_items:
                 # Has new items - use the most recent new item (already sorted by date descending)
                 most_recent_item = new_items[0]
                 new_last_item_id = most_recent_item.id
                 logger.debug(
-                    f"✅ New items found for {feed.name} - updating lastItemId from {last_item_id} to {new_last_item_id}"
+                    "✅ New items found for %s - updating lastItemId from %s to %s",
+                    feed.name,
+                    last_item_id,
+                    new_last_item_id,
                 )
 
                 # Update last_notified_at with the most recent item's date
                 # This ensures we only notify posts created after this point
                 if most_recent_item.pub_date:
                     last_notified = most_recent_item.pub_date
-                    logger.debug(
-                        f"📅 Updating lastNotifiedAt to {last_notified.isoformat()} for {feed.name} "
-                        f"(from most recent new post: {most_recent_item.title[:50]})"
-                    )
+                    if debug:
+                        logger.debug(
+                            "📅 Updating lastNotifiedAt to %s for %s (from most recent new post: %s)",
+                            last_notified.isoformat(),
+                            feed.name,
+                            most_recent_item.title[:50],
+                        )
                 else:
                     # Fallback: use current time if item has no date (shouldn't happen)
                     logger.warning(
                         f"⚠️ New item {new_last_item_id} has no pub_date - using current time as lastNotifiedAt"
                     )
-                    last_notified = datetime.utcnow()
+                    last_notified = now
             elif first_item_id:
                 # No new items but feed has items - update to current first item
                 new_last_item_id = first_item_id
                 logger.debug(
-                    f"ℹ️ No new items for {feed.name} - updating lastItemId to current first item: {first_item_id}"
+                    "ℹ️ No new items for %s - updating lastItemId to current first item: %s",
+                    feed.name,
+                    first_item_id,
                 )
             else:
                 # Feed is empty or firstItemId is undefined - keep existing lastItemId
                 new_last_item_id = last_item_id
                 logger.debug(
-                    f"ℹ️ No new items for {feed.name} - keeping existing lastItemId: {last_item_id}"
+                    "ℹ️ No new items for %s - keeping existing lastItemId: %s",
+                    feed.name,
+                    last_item_id,
                 )
 
-            await feed_service.update_feed_last_check(
-                feed.id,
-                last_item_id=new_last_item_id,
-                last_notified_at=last_notified,
-            )
+            # Written by check_all_feeds: at the end of the cycle, or on the next flush when
+            # only last_check changed
+            last_check_update = {
+                "id": feed.id,
+                "last_check": now,
+                "last_item_id": new_last_item_id,
+                "last_notified_at": last_notified,
+            }
 
             # Send notifications for new items
             notifications_sent = 0
             if new_items:
                 logger.debug(
-                    f"📤 Processing {len(new_items)} new item(s) for notifications to {feed.name}..."
+                    "📤 Processing %d new item(s) for notifications to %s...",
+                    len(new_items),
+                    feed.name,
                 )
-                for item in new_items:
-                    # Check max age
-                    if feed.max_age_minutes:
-                        if item.pub_date:
-                            age_minutes = (datetime.utcnow() - item.pub_date).total_seconds() / 60
-                            if age_minutes > feed.max_age_minutes:
-                                logger.debug(
-                                    f"Skipping item {item.id} - too old ({age_minutes:.1f} minutes)"
-                                )
-                                continue
-
-                    # Send notification
-                    message_sent = False
-                    try:
-                        # Try with HTML first
-                        message = self._format_message(item, feed.name, use_html=True)
-                        result = await bot_service.send_message(
-                            chat_id=int(feed.chat_id),
-                            text=message,
-                            parse_mode="HTML",
-                        )
-
-                        # Check if message was actually sent (result is not None)
-                        if result is not None:
-                            notifications_sent += 1
-                            message_sent = True
-                            logger.info(f"✅ Notification sent for {feed.name}: {item.title}")
-                        else:
-                            # send_message returned None, meaning it failed
-                            logger.warning(
-                                f"⚠️ Message to {feed.name} returned None (failed silently), trying fallback..."
-                            )
-                            raise Exception("Message returned None")
-
-                    except Exception as e:
-                        # If HTML fails, try plain text fallback
-                        logger.warning(
-                            f"⚠️ Failed to send HTML message for {feed.name}: {e}. Trying plain text fallback..."
-                        )
-                        try:
-                            message = self._format_message(item, feed.name, use_html=False)
-                            result = await bot_service.send_message(
-                                chat_id=int(feed.chat_id),
-                                text=message,
-                                parse_mode=None,  # Plain text
-                            )
-
-                            if result is not None:
-                                notifications_sent += 1
-                                message_sent = True
-                                logger.info(
-                                    f"✅ Notification sent (plain text) for {feed.name}: {item.title}"
-                                )
-                            else:
-                                logger.error(
-                                    f"❌ Failed to send plain text message for {feed.name}: message returned None"
-                                )
-                        except Exception as e2:
-                            logger.error(
-                                f"❌ Failed to send notification (both HTML and plain text) for {feed.name}: {e2}"
-                            )
-
-                    if not message_sent:
-                        logger.error(
-                            f"❌ Notification NOT sent for {feed.name}: {item.title} (failed after all retries)"
+                # Compare dates against one cutoff instead of computing each item's age
+                items_to_send = new_items
+                if feed.max_age_minutes:
+                    oldest_allowed = now - timedelta(minutes=feed.max_age_minutes)
+                    items_to_send = [
+                        item
+                        for item in new_items
+                        if not item.pub_date or item.pub_date >= oldest_allowed
+                    ]
+                    if len(items_to_send) < len(new_items):
+                        logger.debug(
+                            "Skipping %d item(s) of %s older than %d minutes",
+                            len(new_items) - len(items_to_send),
+                            feed.name,
+                            feed.max_age_minutes,
                         )
 
-            logger.debug(
-                f"Feed check completed: {feed.name} - {len(new_items)} new items, "
-                f"{notifications_sent} notifications sent"
+                # Drop items already notified for this feed
+                if items_to_send:
+                    items_to_send = await self._drop_seen_items(feed, items_to_send)
+
+                # The feed name is the same for every item, so clean it once per check
+                html_feed_name = _sanitize_html(feed.name)
+                plain_feed_name = _strip_html(feed.name)
+
+                # Enqueue all notifications at once (in item order); bot_service's send queue
+                # applies the per-chat and global (30 msg/s) Telegram rate limits. An unexpected
+                # error in one send must not cancel the others or lose their count
+                sent = await asyncio.gather(
+                    *(
+                        self._send_notification(feed, item, html_feed_name, plain_feed_name)
+                        for item in items_to_send
+                    ),
+                    return_exceptions=True,
+                )
+                notifications_sent = sum(1 for ok in sent if ok is True)
+
+            # One record per feed; it is only worth an INFO line when something was found
+            (logger.info if new_items else logger.debug)(
+                "feed_check",
+                extra={
+                    "feed": feed.name,
+                    "new": len(new_items),
+                    "sent": notifications_sent,
+                    "total": total_items_count,
+                    "duration_ms": round((time.monotonic() - started) * 1000),
+                },
             )
 
             return {
@@ -248,145 +502,182 @@ class FeedChecker:
                 "new_items_count": len(new_items),
                 "notifications_sent": notifications_sent,
                 "total_items_count": total_items_count,
+                "last_check_update": last_check_update,
             }
 
         except Exception as e:
-            logger.error(f"❌ Failed to check feed {feed.name}: {e}", exc_info=True)
+            logger.error("❌ Failed to check feed %s: %s", feed.name, e, exc_info=True)
             return {
                 "success": False,
                 "error": str(e),
             }
 
-    def _format_message(self, item, feed_name: str, use_html: bool = True) -> str:
-        """Format RSS item as Telegram message"""
-        from app.utils.html_sanitizer import sanitize_html_for_telegram, strip_html_tags
-
-        title = item.title or "No title"
-        link = item.link or ""
-        description = item.description or ""
-        pub_date = ""
-
-        if item.pub_date:
-            pub_date = item.pub_date.strftime("%Y-%m-%d %H:%M:%S UTC")
-
-        if use_html:
-            # Sanitize HTML for Telegram
-            title = sanitize_html_for_telegram(title)
-            description = sanitize_html_for_telegram(description) if description else ""
-
-            message = f"📰 <b>{sanitize_html_for_telegram(feed_name)}</b>\n\n"
-            message += f"<b>{title}</b>\n\n"
-
-            if description:
-                # Limit description length
-                max_desc_length = 500
-                if len(description) > max_desc_length:
-                    description = description[:max_desc_length] + "..."
-                message += f"{description}\n\n"
+    async def _send_notification(
+        self, feed: Feed, item, html_feed_name: str, plain_feed_name: str
+    ) -> bool:
+        """Send one item notification, falling back to plain text if HTML fails"""
+        # Shared by both variants; each variant is only built when it is actually sent
+        pub_date = _format_pub_date(item)
+        html_failed = False
+        html_message: Optional[str] = None
+        if time.monotonic() >= self._html_disabled_until.get(feed.id, 0.0):
+            html_message = self._format_message(
+                item, html_feed_name, use_html=True, pub_date=pub_date
+            )
+            # Markup Telegram would reject (e.g. a description cut inside a tag) goes straight
+            # to plain text instead of costing a failed request first
+            if not is_valid_telegram_html(html_message):
+                logger.debug(
+                    "Invalid Telegram HTML for %s: %s - sending plain text", feed.name, item.title
+                )
+                html_message = None
+
+        if html_message is not None:
+            try:
+                # Try with HTML first
+                result = await bot_service.send_message(
+                    chat_id=int(feed.chat_id),
+                    text=html_message,
+                    parse_mode="HTML",
+                )
 
-            if pub_date:
-                message += f"🕐 {pub_date}\n\n"
+                # Check if message was actually sent (result is not None)
+                if result is not None:
+                    logger.debug("✅ Notification sent for %s: %s", feed.name, item.title)
+                    return True
 
-            if link:
-                # Sanitize link URL
-                sanitized_link = sanitize_html_for_telegram(link)
-                message += f"🔗 <a href='{sanitized_link}'>Read more</a>"
-        else:
-            # Plain text fallback
-            title = strip_html_tags(title)
-            description = strip_html_tags(description) if description else ""
-            feed_name = strip_html_tags(feed_name)
+                # send_message returned None, meaning it failed
+                logger.warning(
+                    f"⚠️ Message to {feed.name} returned None (failed silently), trying fallback..."
+                )
+                raise Exception("Message returned None")
 
-            message = f"📰 {feed_name}\n\n"
-            message += f"{title}\n\n"
+            except Exception as e:
+                # If HTML fails, try plain text fallback
+                html_failed = True
+                logger.warning(
+                    f"⚠️ Failed to send HTML message for {feed.name}: {e}. Trying plain text fallback..."
+                )
 
-            if description:
-                max_desc_length = 500
-                if len(description) > max_desc_length:
-                    description = description[:max_desc_length] + "..."
-                message += f"{description}\n\n"
+        try:
+            message = self._format_message(item, plain_feed_name, use_html=False, pub_date=pub_date)
+            result = await bot_service.send_message(
+                chat_id=int(feed.chat_id),
+                text=message,
+                parse_mode=None,  # Plain text
+            )
 
-            if pub_date:
-                message += f"🕐 {pub_date}\n\n"
+            if result is not None:
+                logger.debug("✅ Notification sent (plain text) for %s: %s", feed.name, item.title)
+                if html_failed:
+                    # Plain text works where HTML didn't; skip the HTML attempt for a while
+                    self._html_disabled_until[feed.id] = time.monotonic() + HTML_RETRY_INTERVAL
+                return True
 
-            if link:
-                message += f"🔗 {link}"
+            logger.error(
+                f"❌ Failed to send plain text message for {feed.name}: message returned None"
+            )
+        except Exception as e2:
+            logger.error(
+                f"❌ Failed to send notification (both HTML and plain text) for {feed.name}: {e2}"
+            )
 
-        return message
+        logger.error(
+            f"❌ Notification NOT sent for {feed.name}: {item.title} (failed after all retries)"
+        )
+        return False
+
+    def _format_message(
+        self, item, feed_name: str, use_html: bool = True, pub_date: Optional[str] = None
+    ) -> str:
+        """Format RSS item as Telegram message; feed_name is pre-cleaned for the chosen mode"""
+        if pub_date is None:
+            pub_date = _format_pub_date(item)
+        return (_format_html if use_html else _format_plain)(item, feed_name, pub_date)
+
+    async def _check_feed_limited(self, feed: Feed) -> Dict[str, Any]:
+        """Check a feed once global and per-host slots and a rate limit token are available"""
+        host = urlparse(feed.effective_url).hostname or ""
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._host_semaphores[host] = asyncio.Semaphore(
+                MAX_CONCURRENT_CHECKS_PER_HOST
+            )
+        self._host_users[host] = self._host_users.get(host, 0) + 1
+        try:
+            # Take the host slot first so feeds queued behind a busy host don't hold global slots
+            async with semaphore:
+                async with self._check_semaphore:
+                    async with self._check_limiter:
+                        return await self.check_feed(feed)
+        finally:
+            users = self._host_users[host] - 1
+            if users:
+                self._host_users[host] = users
+            else:
+                del self._host_users[host]
+                del self._host_semaphores[host]
 
     async def check_all_feeds(self):
-        """Check all enabled feeds with smart logging"""
+        """Check all enabled feeds that are due, with smart logging"""
         try:
-            logger.debug("🔍 Fetching enabled feeds from database...")
-            feeds = await feed_service.get_all_enabled_feeds()
-
-            if not feeds:
-                logger.debug("ℹ️ No enabled feeds to check")
+            logger.debug("🔍 Fetching due feeds from database...")
+            # feed_service filters its in-memory feeds by their written last_check; feeds whose
+            # newer last_check is still pending are filtered here
+            now = datetime.utcnow()
+            feeds_to_check = [
+                feed
+                for feed in await feed_service.get_feeds_due_for_check(now)
+                if self._is_due(feed, now)
+            ]
+
+            if not feeds_to_check:
+                logger.debug("ℹ️ No enabled feeds due for check")
                 return
 
             # Track statistics
-            stats = {
-                "total": len(feeds),
-                "checked": 0,
-                "skipped": 0,
-                "errors": 0,
-                "notifications": 0,
-                "error_feeds": [],
-            }
-
-            # Only log start if feeds will be checked
-            feeds_to_check = [f for f in feeds if self._should_check_feed(f)]
-            if feeds_to_check:
-                logger.info(f"🔄 Checking {len(feeds_to_check)} feed(s)...")
+            stats = CycleStats()
 
-            # Process feeds sequentially to avoid rate limiting
-            for feed in feeds:
-                try:
-                    if not self._should_check_feed(feed):
-                        stats["skipped"] += 1
-                        logger.debug(f"⏭️ Skipping {feed.name} - interval not reached")
-                        continue
-
-                    stats["checked"] += 1
-                    result = await self.check_feed(feed)
-
-                    if not result.get("success"):
-                        stats["errors"] += 1
-                        stats["error_feeds"].append(feed.name)
-                        logger.error(f"❌ Failed to check {feed.name}: {result.get('error')}")
-                    else:
-                        notifications = result.get("notifications_sent", 0)
-                        stats["notifications"] += notifications
+            logger.info("🔄 Checking %d feed(s)...", len(feeds_to_check))
 
-                        if notifications > 0:
-                            logger.info(f"✅ {feed.name}: {notifications} notification(s) sent")
-                        else:
-                            logger.debug(f"✓ {feed.name}: No new items")
-
-                    # Small delay between feeds to avoid overwhelming the system
-                    import asyncio
+            # Check feeds concurrently; the semaphores and limiter keep request volume bounded
+            results = await asyncio.gather(
+                *(self._check_feed_limited(feed) for feed in feeds_to_check),
+                return_exceptions=True,
+            )
 
-                    await asyncio.sleep(1)
+            last_check_updates = []
+            for feed, result in zip(feeds_to_check, results):
+                stats.checked += 1
+
+                if isinstance(result, Exception):
+                    stats.errors += 1
+                    self._record_error_feed(stats, feed.name)
+                    logger.error("❌ Error checking feed %s: %s", feed.name, result)
+                elif not result.get("success"):
+                    stats.errors += 1
+                    self._record_error_feed(stats, feed.name)
+                    logger.error("❌ Failed to check %s: %s", feed.name, result.get("error"))
+                else:
+                    update = result["last_check_update"]
+                    if update["last_notified_at"] or update["last_item_id"] != feed.last_item_id:
+                        # Item state changed: write it now, superseding any pending bump
+                        self._pending_last_check.pop(feed.id, None)
+                        last_check_updates.append(update)
+                    else:
+                        self._pending_last_check[feed.id] = update["last_check"]
+                    stats.notifications += result.get("notifications_sent", 0)
 
-                except Exception as e:
-                    stats["errors"] += 1
-                    stats["error_feeds"].append(feed.name)
-                    logger.error(f"❌ Error checking feed {feed.name}: {e}")
-                    continue
+            # Persist changed item state at once; plain last_check bumps wait for the flush
+            await self._write_item_updates(last_check_updates)
+            self._ensure_flush_task()
 
             # Log summary
             self._log_summary(stats)
 
         except Exception as e:
-            logger.error(f"❌ Failed to check all feeds: {e}", exc_info=True)
+            logger.error("❌ Failed to check all feeds: %s", e, exc_info=True)
 
 
 # Global feed checker instance
 feed_checker = FeedChecker()
-
-
-async def check_feeds_job():
-    """APScheduler job function to check all feeds"""
-    logger.debug("🔄 Feed checker job started")
-    await feed_checker.check_all_feeds()
-    logger.debug("✅ Feed checker job completed")
@@ -1,9 +1,10 @@
 """FastAPI application with health check endpoints"""
 
+import asyncio
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.config import settings
 from app.utils.logger import get_logger
@@ -12,6 +13,14 @@ from app.utils.cache import cache_service
 from app.bot import bot_service
 from app.scheduler import scheduler
 
+try:
+    import psutil
+
+    _process: Optional["psutil.Process"] = psutil.Process()
+except ImportError:
+    psutil = None
+    _process = None
+
 logger = get_logger(__name__)
 
 # Global application instance
@@ -19,19 +28,31 @@ app = FastAPI(
     title="RSS Skull Bot",
     description="Modern RSS to Telegram Bot with Reddit support",
     version="0.5.0",
+    # orjson (already used for the Telegram client) serializes responses faster than stdlib json
+    default_response_class=ORJSONResponse,
 )
 
 # Track application start time for uptime calculation
-_app_start_time: Optional[float] = None
+_app_start_time: Optional[float] = None  # time.monotonic(), unaffected by clock changes
+
+# Seconds a /health result is reused, and the last (monotonic time, result)
+HEALTH_CACHE_TTL = 1.0
+_health_cache: Optional[Tuple[float, Tuple[int, Dict[str, Any]]]] = None
+# Held while probing so concurrent requests after expiry wait for one probe run
+_health_lock = asyncio.Lock()
 
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup"""
     global _app_start_time
-    _app_start_time = time.time()
+    _app_start_time = time.monotonic()
     logger.info("Starting RSS Skull Bot application")
 
+    # The first cpu_percent(interval=None) call only starts the measurement
+    if _process is not None:
+        _process.cpu_percent(interval=None)
+
     # Initialize database
     database.initialize()
 
@@ -42,26 +63,28 @@ async def startup_event():
     scheduler.initialize()
     scheduler.start()
 
-    # Add feed checker job (runs every 5 minutes)
-    from app.jobs.feed_checker import check_feeds_job
+    # Start feed checker (sleeps until the next feed is due instead of a fixed tick)
+    from app.jobs.feed_checker import feed_checker
 
-    scheduler.add_interval_job(
-        check_feeds_job,
-        minutes=5,
-        job_id="check_feeds",
-    )
-    logger.info("✅ Feed checker job scheduled")
+    feed_checker.start()
+    logger.info("✅ Feed checker started")
 
     # Add blocking monitor job (runs every hour to check success rates)
-    from app.jobs.blocking_monitor import check_blocking_stats_job, cleanup_blocking_stats_job
-
-    scheduler.add_interval_job(
+    from app.jobs.blocking_monitor import (
         check_blocking_stats_job,
-        minutes=60,
-        job_id="check_blocking_stats",
+        cleanup_blocking_stats_job,
+        flush_blocking_stats_job,
     )
+    from app.services.blocking_stats_service import SUCCESS_FLUSH_INTERVAL
+
+    scheduler.add_interval_job(check_blocking_stats_job, minutes=60, job_id="check_blocking_stats")
     logger.info("✅ Blocking monitor job scheduled")
 
+    # Successful fetches are counted in memory and written in one transaction per interval
+    scheduler.add_interval_job(
+        flush_blocking_stats_job, seconds=SUCCESS_FLUSH_INTERVAL, job_id="flush_blocking_stats"
+    )
+
     # Add blocking stats cleanup job (runs daily at 3 AM UTC)
     scheduler.add_cron_job(
         cleanup_blocking_stats_job,
@@ -73,13 +96,26 @@ async def startup_event():
 
     # Initialize bot
     await bot_service.initialize()
-    # Start polling in background task
-    import asyncio
 
-    try:
-        asyncio.create_task(bot_service.start_polling())
-    except Exception as e:
-        logger.error(f"Failed to start bot polling: {e}")
+    if settings.use_webhook and settings.webhook_url:
+        # Telegram pushes updates to us, no getUpdates loop needed
+        try:
+            await bot_service.start_webhook(
+                settings.webhook_url,
+                secret_token=settings.webhook_secret,
+                path=settings.webhook_path,
+            )
+        except Exception as e:
+            logger.error(f"Failed to start bot webhook, falling back to polling: {e}")
+            asyncio.create_task(bot_service.start_polling())
+    else:
+        if settings.use_webhook:
+            logger.warning("USE_WEBHOOK is set but WEBHOOK_URL is empty - using polling")
+        # Start polling in background task
+        try:
+            asyncio.create_task(bot_service.start_polling())
+        except Exception as e:
+            logger.error(f"Failed to start bot polling: {e}")
 
     # Start keep-alive service
     from app.resilience.keep_alive import keep_alive_service
@@ -98,11 +134,26 @@ async def shutdown_event():
 
     keep_alive_service.stop()
 
+    # Stop feed checker and write last_check times it still holds
+    from app.jobs.feed_checker import feed_checker
+
+    await feed_checker.close()
+
     # Stop bot
     await bot_service.close()
 
-    # Stop scheduler
-    scheduler.stop()
+    # Stop scheduler and any job still running
+    await scheduler.shutdown()
+
+    # Write request successes still buffered in memory
+    from app.jobs.blocking_monitor import blocking_monitor
+
+    blocking_monitor.flush_success_stats()
+
+    # Close feed HTTP sessions and their shared connection pool
+    from app.utils.session_manager import session_manager
+
+    await session_manager.close_all()
 
     # Close cache
     await cache_service.close()
@@ -112,15 +163,27 @@ async def shutdown_event():
 
 
 @app.get("/health")
-async def health_check() -> Dict[str, Any]:
+async def health_check() -> ORJSONResponse:
     """Health check endpoint with minimal logging"""
-    try:
-        import psutil
-
-        process = psutil.Process()
-        memory_info = process.memory_info()
-        memory_percent = process.memory_percent()
-    except ImportError:
+    # Orchestrators poll this every few seconds; reuse a result for HEALTH_CACHE_TTL seconds.
+    # Only the status and payload are cached; each request gets its own response object
+    global _health_cache
+    if _health_cache is None or time.monotonic() - _health_cache[0] >= HEALTH_CACHE_TTL:
+        async with _health_lock:
+            # Another request may have refreshed the cache while this one waited
+            now = time.monotonic()
+            if _health_cache is None or now - _health_cache[0] >= HEALTH_CACHE_TTL:
+                _health_cache = (now, await _run_health_check())
+    status_code, checks = _health_cache[1]
+    return ORJSONResponse(status_code=status_code, content=checks)
+
+
+async def _run_health_check() -> Tuple[int, Dict[str, Any]]:
+    """Run the health checks behind /health; returns (status code, payload)"""
+    if _process is not None:
+        memory_info = _process.memory_info()
+        memory_percent = _process.memory_percent()
+    else:
         try:
             import sys
 
@@ -137,50 +200,45 @@ async def health_check() -> Dict[str, Any]:
             memory_percent = 0.0
 
     current_time = time.time()
-    uptime = (current_time - _app_start_time) if _app_start_time else 0
+    uptime = (time.monotonic() - _app_start_time) if _app_start_time else 0
+    rss = getattr(memory_info, "rss", 0)
 
     checks: Dict[str, Any] = {
         "status": "ok",
         "timestamp": current_time,
         "uptime": uptime,
         "memory": {
-            "rss": getattr(memory_info, "rss", 0),
+            "rss": rss,
             "vms": getattr(memory_info, "vms", 0),
             "usage_percent": memory_percent,
-            "usage_mb": round(getattr(memory_info, "rss", 0) / 1024 / 1024, 2),
+            "usage_mb": round(rss / 1024 / 1024, 2),
         },
         "mode": "full-bot",
     }
 
-    # Check database
-    if database:
+    # Database, Redis and bot are independent round-trips; run them concurrently
+    async def _check(name: str, probe) -> bool:
         try:
-            checks["database"] = await database.health_check()
+            return await probe()
         except Exception as e:
-            logger.error(f"Database health check failed: {e}")
-            checks["database"] = False
+            logger.error(f"{name} health check failed: {e}")
+            return False
+
+    probes = {}
+    if database:
+        probes["database"] = _check("Database", database.health_check)
     else:
         checks["database"] = False
-
-    # Check Redis
-    if not settings.disable_redis:
-        try:
-            checks["redis"] = await cache_service.ping()
-        except Exception as e:
-            logger.error(f"Redis health check failed: {e}")
-            checks["redis"] = False
+    if settings.disable_redis:
+        # Disabled Redis is not a failure
+        checks["redis"] = True
     else:
-        checks["redis"] = settings.disable_redis
-
-    # Check bot
+        probes["redis"] = _check("Redis", cache_service.ping)
     if bot_service:
-        try:
-            checks["bot"] = await bot_service.is_polling_active()
-        except Exception as e:
-            logger.error(f"Bot health check failed: {e}")
-            checks["bot"] = False
+        probes["bot"] = _check("Bot", bot_service.is_polling_active)
     else:
         checks["bot"] = False
+    checks.update(zip(probes, await asyncio.gather(*probes.values())))
 
     # Check scheduler
     if scheduler:
@@ -199,28 +257,25 @@ async def health_check() -> Dict[str, Any]:
     if not is_healthy:
         checks["status"] = "error"
         logger.warning("Health check failed", extra={"checks": checks})
-        return JSONResponse(status_code=503, content=checks)
+        return 503, checks
 
     # Success - log at DEBUG level only
     logger.debug("Health check passed")
-    return checks
+    return 200, checks
 
 
 @app.get("/metrics")
 async def metrics() -> Dict[str, Any]:
     """Metrics endpoint for Prometheus"""
-    try:
-        import psutil
-
-        process = psutil.Process()
-        memory_info = process.memory_info()
-        cpu_percent = process.cpu_percent(interval=0.1)
-    except ImportError:
+    if _process is not None:
+        memory_info = _process.memory_info()
+        # Non-blocking: CPU usage since the previous call (seeded at startup)
+        cpu_percent = _process.cpu_percent(interval=None)
+    else:
         memory_info = type("obj", (object,), {"rss": 0, "vms": 0})()
         cpu_percent = 0.0
 
-    current_time = time.time()
-    uptime_seconds = (current_time - _app_start_time) if _app_start_time else 0
+    uptime_seconds = (time.monotonic() - _app_start_time) if _app_start_time else 0
 
     metrics_data = {
         "memory_rss_bytes": memory_info.rss,
@@ -89,6 +89,11 @@ class Feed(FeedBase, table=True):
         back_populates="feed", sa_relationship_kwargs={"cascade": "all, delete-orphan"}
     )
 
+    @property
+    def effective_url(self) -> str:
+        """URL to fetch: the converted RSS URL, or the original URL if there is none"""
+        return self.rss_url or self.url
+
 
 class FeedFilter(SQLModel, table=True):
     """Feed filter model"""
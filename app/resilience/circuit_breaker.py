@@ -1,6 +1,8 @@
 """Circuit breaker implementation for resilient service calls"""
 
 from enum import Enum
+from functools import lru_cache
+import time
 from typing import Optional, Callable, Any
 from datetime import datetime
 
@@ -20,6 +22,17 @@ class CircuitState(Enum):
 class CircuitBreaker:
     """Circuit breaker for preventing cascading failures"""
 
+    __slots__ = (
+        "failure_threshold",
+        "recovery_timeout",
+        "success_threshold",
+        "state",
+        "failure_count",
+        "success_count",
+        "last_failure_time",
+        "last_state_change",
+    )
+
     def __init__(
         self,
         failure_threshold: int = 5,
@@ -32,59 +45,89 @@ class CircuitBreaker:
         self.state = CircuitState.CLOSED
         self.failure_count = 0
         self.success_count = 0
-        self.last_failure_time: Optional[datetime] = None
-        self.last_state_change: datetime = datetime.utcnow()
+        # time.monotonic() values for timeout checks; get_state() reports wall-clock times
+        # derived from them, so the per-call path never builds datetimes
+        self.last_failure_time: Optional[float] = None
+        self.last_state_change: float = time.monotonic()
 
     def can_execute(self) -> bool:
         """Check if request can be executed"""
-        if self.state == CircuitState.CLOSED:
+        if self.state is CircuitState.CLOSED:
             return True
 
-        if self.state == CircuitState.OPEN:
+        if self.state is CircuitState.OPEN:
             # Check if recovery timeout has passed
-            if self.last_failure_time:
-                time_since_failure = (datetime.utcnow() - self.last_failure_time).total_seconds()
-                if time_since_failure >= self.recovery_timeout:
+            if self.last_failure_time is not None:
+                now = time.monotonic()
+                if now - self.last_failure_time >= self.recovery_timeout:
                     logger.info("Circuit breaker transitioning to HALF_OPEN state")
                     self.state = CircuitState.HALF_OPEN
                     self.success_count = 0
-                    self.last_state_change = datetime.utcnow()
+                    self.last_state_change = now
                     return True
             return False
 
         # HALF_OPEN state
         return True
 
+    def _close(self, now: float):
+        logger.info("Circuit breaker transitioning to CLOSED state")
+        self.state = CircuitState.CLOSED
+        self.failure_count = 0
+        self.success_count = 0
+        self.last_state_change = now
+
+    def _open(self, now: float):
+        self.state = CircuitState.OPEN
+        self.last_state_change = now
+
+    def _success_closed(self, now: float):
+        self.failure_count = 0
+
+    def _success_half_open(self, now: float):
+        self.success_count += 1
+        if self.success_count >= self.success_threshold:
+            self._close(now)
+
+    def _failure_closed(self, now: float):
+        if self.failure_count >= self.failure_threshold:
+            logger.error(f"Circuit breaker opening after {self.failure_count} failures")
+            self._open(now)
+
+    def _failure_half_open(self, now: float):
+        logger.warning("Circuit breaker transitioning back to OPEN state")
+        self._open(now)
+
+    # Per-state handlers, all called as handler(self, now) and looked up once per call instead
+    # of walking an if/elif ladder; states without an entry (OPEN) ignore the event
+    _ON_SUCCESS = {
+        CircuitState.CLOSED: _success_closed,
+        CircuitState.HALF_OPEN: _success_half_open,
+    }
+    _ON_FAILURE = {
+        CircuitState.CLOSED: _failure_closed,
+        CircuitState.HALF_OPEN: _failure_half_open,
+    }
+
     def record_success(self):
         """Record successful execution"""
-        if self.state == CircuitState.HALF_OPEN:
-            self.success_count += 1
-            if self.success_count >= self.success_threshold:
-                logger.info("Circuit breaker transitioning to CLOSED state")
-                self.state = CircuitState.CLOSED
-                self.failure_count = 0
-                self.success_count = 0
-                self.last_state_change = datetime.utcnow()
-        elif self.state == CircuitState.CLOSED:
-            self.failure_count = 0
+        handler = self._ON_SUCCESS.get(self.state)
+        if handler is not None:
+            handler(self, time.monotonic())
 
     def record_failure(self):
         """Record failed execution"""
         self.failure_count += 1
-        self.last_failure_time = datetime.utcnow()
-
-        if self.state == CircuitState.HALF_OPEN:
-            logger.warn("Circuit breaker transitioning back to OPEN state")
-            self.state = CircuitState.OPEN
-            self.last_state_change = datetime.utcnow()
-        elif self.state == CircuitState.CLOSED:
-            if self.failure_count >= self.failure_threshold:
-                logger.error(f"Circuit breaker opening after {self.failure_count} failures")
-                self.state = CircuitState.OPEN
-                self.last_state_change = datetime.utcnow()
+        now = self.last_failure_time = time.monotonic()
+
+        handler = self._ON_FAILURE.get(self.state)
+        if handler is not None:
+            handler(self, now)
 
     async def execute(self, func: Callable, *args, **kwargs) -> Any:
         """Execute function with circuit breaker protection"""
+        # The check and the record calls are synchronous, so each runs without yielding to
+        # other tasks on the event loop; only the awaited call itself interleaves
         if not self.can_execute():
             raise Exception("Circuit breaker is OPEN - request rejected")
 
@@ -98,23 +141,25 @@ class CircuitBreaker:
 
     def get_state(self) -> dict:
         """Get current circuit breaker state"""
+        # Map monotonic timestamps onto the wall clock only when reporting
+        offset = time.time() - time.monotonic()
         return {
             "state": self.state.value,
             "failure_count": self.failure_count,
             "success_count": self.success_count,
             "last_failure_time": (
-                self.last_failure_time.isoformat() if self.last_failure_time else None
+                datetime.utcfromtimestamp(self.last_failure_time + offset).isoformat()
+                if self.last_failure_time is not None
+                else None
             ),
-            "last_state_change": self.last_state_change.isoformat(),
+            "last_state_change": datetime.utcfromtimestamp(
+                self.last_state_change + offset
+            ).isoformat(),
         }
 
 
-# Global circuit breakers per domain
-_circuit_breakers: dict[str, CircuitBreaker] = {}
-
-
+# One circuit breaker per domain, created on first use; clear with get_circuit_breaker.cache_clear()
+@lru_cache(maxsize=None)
 def get_circuit_breaker(domain: str) -> CircuitBreaker:
     """Get or create circuit breaker for a domain"""
-    if domain not in _circuit_breakers:
-        _circuit_breakers[domain] = CircuitBreaker()
-    return _circuit_breakers[domain]
+    return CircuitBreaker()
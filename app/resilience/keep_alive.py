@@ -10,6 +10,11 @@ from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
 
 class KeepAliveService:
     """Service to keep the process alive and monitor health"""
@@ -21,6 +26,8 @@ class KeepAliveService:
         self._heartbeat_task: Optional[asyncio.Task] = None
         self._keep_alive_task: Optional[asyncio.Task] = None
         self.start_time = datetime.utcnow()
+        # Process handle reused by every heartbeat instead of being rebuilt each time
+        self._process = psutil.Process() if psutil is not None else None
 
     def _get_heartbeat_interval(self) -> int:
         """Get heartbeat interval based on environment"""
@@ -81,13 +88,9 @@ class KeepAliveService:
                 uptime = (datetime.utcnow() - self.start_time).total_seconds()
                 uptime_minutes = int(uptime / 60)
 
-                try:
-                    import psutil
-
-                    process = psutil.Process()
-                    memory_info = process.memory_info()
-                    memory_mb = round(memory_info.rss / 1024 / 1024)
-                except ImportError:
+                if self._process is not None:
+                    memory_mb = round(self._process.memory_info().rss / 1024 / 1024)
+                else:
                     try:
                         import resource
 
@@ -127,19 +130,9 @@ class KeepAliveService:
         """Keep-alive loop to prevent event loop from emptying"""
         try:
             while self.running:
+                # The pending sleep is what keeps the event loop active
                 await asyncio.sleep(self.keep_alive_interval)
 
-                # Simple check to keep event loop active
-                try:
-                    import psutil
-
-                    process = psutil.Process()
-                    memory_info = process.memory_info()
-                    if memory_info.rss == 0:
-                        logger.error("CRITICAL: Process memory is 0 - this should never happen!")
-                except Exception:
-                    pass
-
         except asyncio.CancelledError:
             logger.debug("Keep-alive loop cancelled")
         except Exception as e:
@@ -1,6 +1,7 @@
 """Retry logic with exponential backoff"""
 
-from typing import Callable, Optional, Any
+from functools import lru_cache
+from typing import Callable, Optional, Any, Tuple
 import asyncio
 import random
 
@@ -9,6 +10,12 @@ from app.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _backoff_schedule(max_retries: int, base_delay: float, max_delay: float) -> Tuple[float, ...]:
+    """Delay before each retry: base_delay doubling per attempt, capped at max_delay"""
+    return tuple(min(base_delay * (2**attempt), max_delay) for attempt in range(max_retries))
+
+
 async def retry_with_backoff(
     func: Callable,
     max_retries: int = 3,
@@ -29,6 +36,7 @@ async def retry_with_backoff(
         on_retry: Optional callback function called on each retry
     """
     last_exception: Optional[Exception] = None
+    schedule = _backoff_schedule(max_retries, base_delay, max_delay)
 
     for attempt in range(max_retries + 1):
         try:
@@ -37,13 +45,11 @@ async def retry_with_backoff(
             last_exception = e
 
             if attempt < max_retries:
-                # Calculate delay with exponential backoff
-                delay = min(base_delay * (2**attempt), max_delay)
+                delay = schedule[attempt]
 
-                # Add jitter if enabled
+                # Add up to 10% jitter if enabled
                 if jitter:
-                    jitter_amount = delay * 0.1 * random.random()
-                    delay += jitter_amount
+                    delay *= 1 + 0.1 * random.random()
 
                 logger.warn(f"Retry attempt {attempt + 1}/{max_retries} after {delay:.2f}s: {e}")
 
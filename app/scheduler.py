@@ -1,105 +1,192 @@
-"""APScheduler setup for recurring jobs"""
+"""asyncio scheduler for recurring jobs"""
 
-from typing import Optional
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.jobstores.memory import MemoryJobStore
-from apscheduler.executors.asyncio import AsyncIOExecutor
-from apscheduler.triggers.interval import IntervalTrigger
-from apscheduler.triggers.cron import CronTrigger
+import asyncio
+import heapq
+import itertools
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
 
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+def _next_daily_run(hour: int, minute: int, now: float) -> float:
+    """Next epoch time after now at hour:minute UTC"""
+    current = datetime.fromtimestamp(now, timezone.utc)
+    run = current.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if run.timestamp() <= now:
+        run += timedelta(days=1)
+    return run.timestamp()
+
+
+@dataclass(slots=True, eq=False)
+class ScheduledJob:
+    """A recurring job: every `interval` seconds, or daily at hour:minute UTC"""
+
+    id: str
+    func: Callable[..., Awaitable[Any]]
+    args: Sequence[Any] = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    interval: Optional[float] = None
+    hour: int = 0
+    minute: int = 0
+    next_run_time: float = 0.0  # time.monotonic() deadline
+    task: Optional[asyncio.Task] = None
+
+    def schedule_next(self):
+        """Set next_run_time to the next run from now"""
+        now = time.monotonic()
+        if self.interval is not None:
+            self.next_run_time = now + self.interval
+        else:
+            # Only the daily time of day needs the wall clock; convert it to a monotonic
+            # deadline so clock steps don't make interval jobs burst or stall
+            wall_now = time.time()
+            self.next_run_time = now + _next_daily_run(self.hour, self.minute, wall_now) - wall_now
+
+
 class SchedulerService:
-    """Scheduler service using APScheduler"""
+    """Scheduler keeping jobs in a heap ordered by next run time, run by one asyncio task"""
 
     def __init__(self):
-        self.scheduler: Optional[AsyncIOScheduler] = None
         self.running = False
+        self._jobs: Dict[str, ScheduledJob] = {}
+        # (next_run_time, sequence, job); entries for removed or replaced jobs are skipped
+        self._heap: List[Tuple[float, int, ScheduledJob]] = []
+        self._sequence = itertools.count()
+        self._changed: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
 
     def initialize(self):
         """Initialize scheduler"""
-        try:
-            jobstores = {"default": MemoryJobStore()}
-            executors = {"default": AsyncIOExecutor()}
-            job_defaults = {"coalesce": False, "max_instances": 1, "misfire_grace_time": 30}
-
-            self.scheduler = AsyncIOScheduler(
-                jobstores=jobstores, executors=executors, job_defaults=job_defaults, timezone="UTC"
-            )
-
-            logger.info("Scheduler initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize scheduler: {e}")
-            raise
+        self._jobs.clear()
+        self._heap.clear()
+        self._changed = asyncio.Event()
+        logger.info("Scheduler initialized successfully")
 
     def start(self):
         """Start scheduler"""
-        if not self.scheduler:
+        if self._changed is None:
             raise RuntimeError("Scheduler not initialized. Call initialize() first.")
 
-        try:
-            self.scheduler.start()
-            self.running = True
-            logger.info("Scheduler started")
-        except Exception as e:
-            logger.error(f"Failed to start scheduler: {e}")
-            raise
-
-    def stop(self):
-        """Stop scheduler"""
-        if self.scheduler:
-            try:
-                self.scheduler.shutdown(wait=True)
-                self.running = False
-                logger.info("Scheduler stopped")
-            except Exception as e:
-                logger.error(f"Failed to stop scheduler: {e}")
-
-    def add_job(self, func, trigger, job_id: Optional[str] = None, **kwargs):
-        """Add a job to the scheduler"""
-        if not self.scheduler:
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._run())
+        self.running = True
+        logger.info("Scheduler started")
+
+    def stop(self) -> List[asyncio.Task]:
+        """Stop scheduler, cancelling running jobs; returns the cancelled tasks"""
+        cancelled = []
+        if self._task:
+            self._task.cancel()
+            cancelled.append(self._task)
+            self._task = None
+        for job in self._jobs.values():
+            if job.task and not job.task.done():
+                job.task.cancel()
+                cancelled.append(job.task)
+        if self.running:
+            self.running = False
+            logger.info("Scheduler stopped")
+        return cancelled
+
+    async def shutdown(self):
+        """Stop scheduler and wait for the cancelled loop and jobs to finish"""
+        await asyncio.gather(*self.stop(), return_exceptions=True)
+
+    def _push(self, job: ScheduledJob):
+        heapq.heappush(self._heap, (job.next_run_time, next(self._sequence), job))
+
+    def _add(self, func, job_id: Optional[str], options: Dict[str, Any], **timing):
+        """Build a job from the add_*_job arguments and schedule it, replacing one with its id"""
+        if self._changed is None:
             raise RuntimeError("Scheduler not initialized. Call initialize() first.")
 
-        try:
-            self.scheduler.add_job(
-                func, trigger=trigger, id=job_id, replace_existing=True, **kwargs
-            )
-            logger.info(f"Job added: {job_id or func.__name__}")
-        except Exception as e:
-            logger.error(f"Failed to add job: {e}")
-            raise
-
-    def add_interval_job(self, func, minutes: int, job_id: Optional[str] = None, **kwargs):
-        """Add an interval job"""
-        trigger = IntervalTrigger(minutes=minutes)
-        self.add_job(func, trigger, job_id=job_id, **kwargs)
+        # args/kwargs are the job options callers passed through to APScheduler's add_job
+        args = options.pop("args", ())
+        kwargs = options.pop("kwargs", None) or {}
+        if options:
+            raise TypeError(f"Unsupported job options: {', '.join(options)}")
+
+        job = ScheduledJob(id=job_id or func.__name__, func=func, args=args, kwargs=kwargs, **timing)
+        job.schedule_next()
+        # Replaces a job with the same id; its heap entry is dropped when reached
+        self._jobs[job.id] = job
+        self._push(job)
+        self._changed.set()
+        logger.info(f"Job added: {job.id}")
+
+    def add_interval_job(
+        self,
+        func,
+        minutes: int = 0,
+        job_id: Optional[str] = None,
+        seconds: float = 0,
+        **kwargs,
+    ):
+        """Add an interval job run every `minutes` minutes plus `seconds` seconds"""
+        interval = minutes * 60 + seconds
+        if interval <= 0:
+            raise ValueError("Interval must be positive")
+        self._add(func, job_id, kwargs, interval=interval)
 
     def add_cron_job(
         self, func, hour: int = 0, minute: int = 0, job_id: Optional[str] = None, **kwargs
     ):
-        """Add a cron job"""
-        trigger = CronTrigger(hour=hour, minute=minute)
-        self.add_job(func, trigger, job_id=job_id, **kwargs)
+        """Add a cron job (daily at hour:minute UTC)"""
+        self._add(func, job_id, kwargs, hour=hour, minute=minute)
 
     def remove_job(self, job_id: str):
         """Remove a job from the scheduler"""
-        if not self.scheduler:
-            raise RuntimeError("Scheduler not initialized. Call initialize() first.")
+        if self._jobs.pop(job_id, None) is None:
+            logger.error(f"Failed to remove job: {job_id}: no such job")
+            return
 
-        try:
-            self.scheduler.remove_job(job_id)
-            logger.info(f"Job removed: {job_id}")
-        except Exception as e:
-            logger.error(f"Failed to remove job: {job_id}: {e}")
+        if self._changed is not None:
+            self._changed.set()
+        logger.info(f"Job removed: {job_id}")
 
-    def get_jobs(self):
+    def get_jobs(self) -> List[ScheduledJob]:
         """Get all scheduled jobs"""
-        if not self.scheduler:
-            return []
-        return self.scheduler.get_jobs()
+        return list(self._jobs.values())
+
+    async def _run(self):
+        """Sleep until the earliest job is due, start it and schedule its next run"""
+        while True:
+            self._changed.clear()
+            delay = self._heap[0][0] - time.monotonic() if self._heap else None
+            if delay is None or delay > 0:
+                # Woken early when a job is added or removed
+                try:
+                    await asyncio.wait_for(self._changed.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            _, _, job = heapq.heappop(self._heap)
+            if self._jobs.get(job.id) is not job:
+                continue
+
+            if job.task is None or job.task.done():
+                job.task = asyncio.create_task(self._run_job(job))
+            else:
+                logger.warning(f"Job {job.id} is still running - skipping this run")
+
+            job.schedule_next()
+            self._push(job)
+
+    async def _run_job(self, job: ScheduledJob):
+        """Run one job, logging failures so later runs still happen"""
+        try:
+            await job.func(*job.args, **job.kwargs)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Job %s failed: %s", job.id, e, exc_info=True)
 
 
 # Global scheduler instance
@@ -1,7 +1,8 @@
 """Blocking statistics service for tracking and persisting anti-blocking metrics"""
 
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List
+from typing import Optional, Dict, Iterable, Iterator, List, Tuple
 from sqlmodel import Session, select
 import uuid
 
@@ -10,12 +11,78 @@ from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Success rate percentage as a SQL expression (callers must exclude total_requests == 0)
+_SUCCESS_RATE = (BlockingStats.successful_requests * 100.0 / BlockingStats.total_requests).label(
+    "success_rate"
+)
+
+# Seconds between writes of buffered request successes
+SUCCESS_FLUSH_INTERVAL = 60
+
+
+@dataclass(slots=True)
+class _PendingSuccess:
+    """Successful requests for a domain not yet written to the database"""
+
+    count: int = 0
+    last_success: Optional[datetime] = None
+    user_agent: Optional[str] = None
+    delay: Optional[float] = None
+
+
+class SuccessStatsBuffer:
+    """Successful requests per domain recorded in memory until BlockingStatsService writes them
+
+    Every successful fetch lands here instead of costing its own SELECT, UPDATE and commit.
+    """
+
+    def __init__(self):
+        self._pending: Dict[str, _PendingSuccess] = {}
+
+    def record(self, domain: str, user_agent: Optional[str] = None, delay: Optional[float] = None):
+        """Record a successful request"""
+        pending = self._pending.get(domain)
+        if pending is None:
+            pending = self._pending[domain] = _PendingSuccess()
+        pending.count += 1
+        pending.last_success = datetime.utcnow()
+        if user_agent:
+            pending.user_agent = user_agent
+        if delay is not None:
+            pending.delay = delay
+
+    def take(self, domains: Optional[Iterable[str]] = None) -> Dict[str, _PendingSuccess]:
+        """Remove and return pending successes for all domains, or only the given ones"""
+        if domains is None:
+            taken, self._pending = self._pending, {}
+            return taken
+        return {
+            domain: self._pending.pop(domain) for domain in domains if domain in self._pending
+        }
+
+    def restore(self, taken: Dict[str, _PendingSuccess]):
+        """Put back entries whose write failed, merged with anything recorded since"""
+        for domain, pending in taken.items():
+            newer = self._pending.get(domain)
+            if newer is not None:
+                pending.count += newer.count
+                pending.last_success = newer.last_success
+                pending.user_agent = newer.user_agent or pending.user_agent
+                if newer.delay is not None:
+                    pending.delay = newer.delay
+            self._pending[domain] = pending
+
+
+# Global buffer instance
+success_stats_buffer = SuccessStatsBuffer()
+
 
 class BlockingStatsService:
     """Service for managing blocking statistics and learned behaviors"""
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, success_buffer: SuccessStatsBuffer = success_stats_buffer):
         self.session = session
+        self.success_buffer = success_buffer
 
     def get_or_create_stats(self, domain: str) -> BlockingStats:
         """Get existing stats or create new entry for domain"""
@@ -40,33 +107,50 @@ class BlockingStatsService:
 
         return stats
 
-    def record_request_success(
-        self, domain: str, user_agent: Optional[str] = None, delay: Optional[float] = None
-    ) -> BlockingStats:
-        """Record a successful request"""
-        stats = self.get_or_create_stats(domain)
-
-        stats.total_requests += 1
-        stats.successful_requests += 1
-        stats.last_success = datetime.utcnow()
+    def _apply_pending_success(self, stats: BlockingStats, pending: _PendingSuccess):
+        """Add buffered successes to a domain's stats row (caller commits)"""
+        stats.total_requests += pending.count
+        stats.successful_requests += pending.count
+        stats.last_success = pending.last_success
         stats.updated_at = datetime.utcnow()
+        if pending.user_agent:
+            stats.preferred_user_agent = pending.user_agent
+        if pending.delay is not None:
+            stats.current_delay = pending.delay
+        self.session.add(stats)
 
-        # Update preferred User-Agent if provided
-        if user_agent:
-            stats.preferred_user_agent = user_agent
-
-        # Update current delay if provided
-        if delay is not None:
-            stats.current_delay = delay
+    def flush_pending_successes(self, domains: Optional[Iterable[str]] = None) -> int:
+        """Write buffered successes (for all domains, or only domains) in one commit
+
+        Entries are put back in the buffer if the write fails.
+        """
+        taken = self.success_buffer.take(domains)
+        if not taken:
+            return 0
+
+        try:
+            # Rows are created (and committed) before any counts change, so the single
+            # commit below either writes every domain's counts or none of them
+            rows = [
+                (self.get_or_create_stats(domain), pending) for domain, pending in taken.items()
+            ]
+            for stats, pending in rows:
+                self._apply_pending_success(stats, pending)
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            self.success_buffer.restore(taken)
+            raise
 
-        self.session.add(stats)
-        self.session.commit()
-        self.session.refresh(stats)
+        logger.debug("Flushed buffered successes for %d domain(s)", len(taken))
+        return len(taken)
 
-        logger.debug(
-            f"Recorded success for {domain}: {stats.successful_requests}/{stats.total_requests}"
-        )
-        return stats
+    def _flush_before_read(self, domains: Optional[Iterable[str]] = None):
+        """Flush buffered successes so reads see current counts; a failed flush is logged"""
+        try:
+            self.flush_pending_successes(domains)
+        except Exception as e:
+            logger.error("Failed to flush buffered successes: %s", e)
 
     def record_request_failure(
         self,
@@ -77,6 +161,10 @@ class BlockingStatsService:
     ) -> BlockingStats:
         """Record a failed request with status code"""
         stats = self.get_or_create_stats(domain)
+        # Counts and the success rate read after this must include buffered successes
+        taken = self.success_buffer.take((domain,))
+        if domain in taken:
+            self._apply_pending_success(stats, taken[domain])
 
         stats.total_requests += 1
         stats.last_failure = datetime.utcnow()
@@ -99,7 +187,12 @@ class BlockingStatsService:
             stats.circuit_breaker_state = circuit_breaker_state
 
         self.session.add(stats)
-        self.session.commit()
+        try:
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            self.success_buffer.restore(taken)
+            raise
         self.session.refresh(stats)
 
         logger.debug(
@@ -149,11 +242,13 @@ class BlockingStatsService:
 
     def get_stats(self, domain: str) -> Optional[BlockingStats]:
         """Get statistics for a specific domain"""
+        self._flush_before_read((domain,))
         statement = select(BlockingStats).where(BlockingStats.domain == domain)
         return self.session.exec(statement).first()
 
     def get_all_stats(self) -> List[BlockingStats]:
         """Get statistics for all domains"""
+        self._flush_before_read()
         statement = select(BlockingStats)
         return list(self.session.exec(statement).all())
 
@@ -167,19 +262,30 @@ class BlockingStatsService:
 
     def get_domains_with_low_success_rate(self, threshold: float = 50.0) -> List[BlockingStats]:
         """Get domains with success rate below threshold"""
-        all_stats = self.get_all_stats()
-        low_success_domains = []
-
-        for stats in all_stats:
-            if stats.total_requests > 0:
-                success_rate = (stats.successful_requests / stats.total_requests) * 100
-                if success_rate < threshold:
-                    low_success_domains.append(stats)
+        self._flush_before_read()
+        statement = select(BlockingStats).where(
+            BlockingStats.total_requests > 0, _SUCCESS_RATE < threshold
+        )
+        return list(self.session.exec(statement).all())
 
-        return low_success_domains
+    def get_low_success_rates(self, threshold: float = 50.0) -> Iterator[Tuple[str, int, float]]:
+        """Iterate (domain, total_requests, success_rate) for domains below threshold
+
+        Filtering and the rate calculation happen in SQL; no ORM objects are loaded.
+        Rows are fetched in batches of 100, so consume the iterator while the session is open.
+        """
+        self._flush_before_read()
+        statement = (
+            select(BlockingStats.domain, BlockingStats.total_requests, _SUCCESS_RATE)
+            .where(BlockingStats.total_requests > 0, _SUCCESS_RATE < threshold)
+            .execution_options(yield_per=100)
+        )
+        for domain, total_requests, success_rate in self.session.exec(statement):
+            yield domain, total_requests, success_rate
 
     def get_domains_by_circuit_breaker_state(self, state: str) -> List[BlockingStats]:
         """Get domains with specific circuit breaker state"""
+        self._flush_before_read()
         statement = select(BlockingStats).where(BlockingStats.circuit_breaker_state == state)
         return list(self.session.exec(statement).all())
 
@@ -211,8 +317,36 @@ class BlockingStatsService:
 
     def get_summary(self) -> Dict:
         """Get summary of all blocking statistics"""
-        all_stats = self.get_all_stats()
+        return self._summarize(self.get_all_stats())
+
+    def get_full_report(self, low_success_threshold: float = 50.0) -> Dict:
+        """Get summary, per-domain stats and low success domains from a single query
+
+        Returns: {
+            'summary': Dict (same shape as get_summary()),
+            'stats': List[BlockingStats] ordered by total_requests descending,
+            'low_success': List[BlockingStats] below low_success_threshold
+        }
+        """
+        self._flush_before_read()
+        statement = select(BlockingStats).order_by(BlockingStats.total_requests.desc())
+        all_stats = list(self.session.exec(statement).all())
+
+        low_success = [
+            stats
+            for stats in all_stats
+            if stats.total_requests > 0
+            and (stats.successful_requests / stats.total_requests) * 100 < low_success_threshold
+        ]
+
+        return {
+            "summary": self._summarize(all_stats),
+            "stats": all_stats,
+            "low_success": low_success,
+        }
 
+    def _summarize(self, all_stats: List[BlockingStats]) -> Dict:
+        """Aggregate already-loaded statistics into a summary"""
         total_domains = len(all_stats)
         total_requests = sum(s.total_requests for s in all_stats)
         total_successful = sum(s.successful_requests for s in all_stats)
@@ -1,9 +1,11 @@
 """Feed service for managing feeds"""
 
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+import asyncio
+from typing import Optional, Dict, Any, List, Tuple
+from datetime import datetime, timedelta
 from uuid import uuid4
 from sqlmodel import select
+from sqlalchemy import bindparam, func, update
 
 from app.database import database
 from app.models.feed import Feed, Chat
@@ -12,10 +14,50 @@ from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_feed_table = Feed.__table__
+
+# executemany UPDATE for bulk_update_last_check; NULL item id/date keeps the stored value
+_BULK_LAST_CHECK_UPDATE = (
+    update(_feed_table)
+    .where(_feed_table.c.id == bindparam("b_id"))
+    .values(
+        last_check=bindparam("b_last_check", type_=_feed_table.c.last_check.type),
+        last_item_id=func.coalesce(
+            bindparam("b_last_item_id", type_=_feed_table.c.last_item_id.type),
+            _feed_table.c.last_item_id,
+        ),
+        last_notified_at=func.coalesce(
+            bindparam("b_last_notified_at", type_=_feed_table.c.last_notified_at.type),
+            _feed_table.c.last_notified_at,
+        ),
+    )
+)
+
 
 class FeedService:
     """Service for managing feeds"""
 
+    def __init__(self):
+        # feed_id -> enabled Feed, kept between check cycles; None until loaded or after a
+        # command changed which feeds exist or are enabled
+        self._enabled_feeds: Optional[Dict[str, Feed]] = None
+        # Set when feeds are added, removed, enabled or disabled; the feed checker waits on
+        # it so a changed schedule is picked up without waiting out its sleep
+        self.feeds_changed = asyncio.Event()
+
+    def _feeds_changed(self):
+        """Drop the enabled feed cache and signal feeds_changed"""
+        self._enabled_feeds = None
+        self.feeds_changed.set()
+
+    def _get_enabled_feeds_cached(self) -> List[Feed]:
+        """Enabled feeds from memory, loading them from the database when needed"""
+        if self._enabled_feeds is None:
+            with database.get_session() as session:
+                feeds = session.exec(select(Feed).where(Feed.enabled)).all()
+                self._enabled_feeds = {feed.id: feed for feed in feeds}
+        return list(self._enabled_feeds.values())
+
     async def list_feeds(self, chat_id: str) -> List[Feed]:
         """List all feeds for a chat"""
         with database.get_session() as session:
@@ -111,6 +153,7 @@ class FeedService:
                 session.refresh(feed)
 
                 logger.info(f"Feed added: {chat_id}/{name}")
+                self._feeds_changed()
                 return {"success": True, "feed": feed}
 
         except Exception as e:
@@ -129,6 +172,7 @@ class FeedService:
                 session.commit()
 
                 logger.info(f"Feed removed: {chat_id}/{name}")
+                self._feeds_changed()
                 return {"success": True}
 
         except Exception as e:
@@ -148,6 +192,7 @@ class FeedService:
                 session.commit()
 
                 logger.info(f"Feed enabled: {chat_id}/{name}")
+                self._feeds_changed()
                 return {"success": True}
 
         except Exception as e:
@@ -167,6 +212,7 @@ class FeedService:
                 session.commit()
 
                 logger.info(f"Feed disabled: {chat_id}/{name}")
+                self._feeds_changed()
                 return {"success": True}
 
         except Exception as e:
@@ -204,6 +250,30 @@ class FeedService:
             logger.error(f"❌ Failed to get enabled feeds from database: {e}", exc_info=True)
             return []
 
+    async def get_check_schedule(self) -> List[Tuple[str, Optional[datetime], int]]:
+        """Get (id, last_check, check_interval_minutes) for every enabled feed"""
+        try:
+            return [
+                (feed.id, feed.last_check, feed.check_interval_minutes)
+                for feed in self._get_enabled_feeds_cached()
+            ]
+        except Exception as e:
+            logger.error(f"❌ Failed to get feed check schedule: {e}", exc_info=True)
+            return []
+
+    async def get_feeds_due_for_check(self, now: datetime) -> List[Feed]:
+        """Get enabled feeds whose check interval has elapsed at ``now``"""
+        try:
+            return [
+                feed
+                for feed in self._get_enabled_feeds_cached()
+                if feed.last_check is None
+                or now - feed.last_check >= timedelta(minutes=feed.check_interval_minutes)
+            ]
+        except Exception as e:
+            logger.error(f"❌ Failed to get due feeds from database: {e}", exc_info=True)
+            return []
+
     async def update_feed_last_check(
         self,
         feed_id: str,
@@ -211,26 +281,86 @@ class FeedService:
         last_notified_at: Optional[datetime] = None,
     ):
         """Update feed's last check time and last item ID"""
+        # Same single UPDATE as the bulk path, instead of loading the row and saving it back
+        await self.bulk_update_last_check(
+            [
+                {
+                    "id": feed_id,
+                    "last_check": datetime.utcnow(),
+                    "last_item_id": last_item_id or None,
+                    "last_notified_at": last_notified_at,
+                }
+            ]
+        )
+
+    async def bulk_update_last_check(self, updates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Update last check time and last item for many feeds in one transaction
+
+        Each update has ``id``, ``last_check`` and optional ``last_item_id``/``last_notified_at``
+        (a missing or None value keeps the stored one, as in update_feed_last_check).
+        If the batch fails, each feed is retried in its own transaction so one bad row doesn't
+        hold back the rest. Returns the updates that could not be written, so callers can
+        retry them.
+        """
+        if not updates:
+            return []
+
+        params = [
+            {
+                "b_id": u["id"],
+                "b_last_check": u["last_check"],
+                "b_last_item_id": u.get("last_item_id"),
+                "b_last_notified_at": u.get("last_notified_at"),
+            }
+            for u in updates
+        ]
+
         try:
-            with database.get_session() as session:
-                feed = session.get(Feed, feed_id)
-                if feed:
-                    feed.last_check = datetime.utcnow()
-                    if last_item_id:
-                        feed.last_item_id = last_item_id
-                        logger.debug(f"Updated feed {feed.name} lastItemId: {last_item_id}")
-                    if last_notified_at:
-                        feed.last_notified_at = last_notified_at
-                        logger.debug(
-                            f"Updated feed {feed.name} lastNotifiedAt: {last_notified_at.isoformat()}"
-                        )
-                    session.add(feed)
-                    session.commit()
-                    logger.debug(
-                        f"Feed {feed.name} last check updated: {feed.last_check.isoformat()}"
-                    )
+            self._write_last_checks(params)
+            logger.debug(f"Updated last check for {len(params)} feed(s)")
+            written, failed = updates, []
         except Exception as e:
-            logger.error(f"Failed to update feed last check: {e}")
+            logger.error(f"Failed to bulk update feed last check, retrying per feed: {e}")
+            written, failed = [], []
+            for u, p in zip(updates, params):
+                try:
+                    self._write_last_checks([p])
+                    written.append(u)
+                except Exception as row_error:
+                    logger.error(f"Failed to update last check for feed {u['id']}: {row_error}")
+                    failed.append(u)
+
+        # Keep the in-memory feeds in step with what was written
+        if self._enabled_feeds is not None:
+            for u in written:
+                feed = self._enabled_feeds.get(u["id"])
+                if feed is None:
+                    continue
+                feed.last_check = u["last_check"]
+                if u.get("last_item_id"):
+                    feed.last_item_id = u["last_item_id"]
+                if u.get("last_notified_at"):
+                    feed.last_notified_at = u["last_notified_at"]
+        return failed
+
+    def _write_last_checks(self, params: List[Dict[str, Any]]):
+        """Run the last check UPDATE for params in one transaction"""
+        with database.get_session() as session:
+            session.connection().execute(_BULK_LAST_CHECK_UPDATE, params)
+            session.commit()
+
+    async def bulk_bump_last_check(self, last_checks: Dict[str, datetime]) -> Dict[str, datetime]:
+        """Advance only the last check time for many feeds (feed_id -> last_check)
+
+        Returns the entries that could not be written.
+        """
+        failed = await self.bulk_update_last_check(
+            [
+                {"id": feed_id, "last_check": checked_at}
+                for feed_id, checked_at in last_checks.items()
+            ]
+        )
+        return {u["id"]: u["last_check"] for u in failed}
 
 
 # Global feed service instance
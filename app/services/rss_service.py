@@ -3,9 +3,12 @@
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 import asyncio
+import logging
+import time
 import aiohttp
 import feedparser
 from urllib.parse import urlparse
+from dateutil import parser as date_parser
 
 from app.utils.logger import get_logger
 from app.utils.cache import cache_service
@@ -17,11 +20,19 @@ from app.utils.session_manager import session_manager
 from app.services.reddit_fallback import reddit_fallback
 from app.services.blocking_alert_service import blocking_alert_service
 from app.database import database
-from app.services.blocking_stats_service import BlockingStatsService
+from app.services.blocking_stats_service import BlockingStatsService, success_stats_buffer
 from app.config import settings
 
 logger = get_logger(__name__)
 
+# Settings are fixed for the process lifetime; bind the alert target once
+_ADMIN_CHAT_ID = settings.allowed_user_id
+
+# Seconds a fetched feed is served from Redis without a request, and how long the body and
+# its ETag/Last-Modified are kept for conditional revalidation (304) after that
+FEED_FRESH_TTL = 300
+FEED_CACHE_TTL = 3600
+
 
 # Import reddit_fallback here to avoid circular dependency
 def get_reddit_fallback():
@@ -112,19 +123,10 @@ class RSSService:
         self.base_delay = 1000  # milliseconds
         self.max_delay = 30000  # milliseconds
         self.timeout = 30  # seconds
-        self._session: Optional[aiohttp.ClientSession] = None
-
-    async def initialize(self):
-        """Initialize HTTP session"""
-        if not self._session:
-            timeout = aiohttp.ClientTimeout(total=self.timeout)
-            self._session = aiohttp.ClientSession(timeout=timeout)
-
-    async def close(self):
-        """Close HTTP session"""
-        if self._session:
-            await self._session.close()
-            self._session = None
+        # Fetches go through session_manager's sessions, which share one keep-alive pool
+        self._request_timeout = aiohttp.ClientTimeout(total=self.timeout)
+        # url -> fetch in progress, shared by concurrent checks of the same feed
+        self._inflight_fetches: Dict[str, asyncio.Task] = {}
 
     def extract_domain(self, url: str) -> str:
         """Extract domain from URL"""
@@ -184,11 +186,11 @@ class RSSService:
         # Check if this is a YouTube URL - if so, use YouTube service
         youtube_service = get_youtube_service()
         if youtube_service.is_youtube_url(url):
-            logger.info(f"🔄 Detected YouTube URL (not RSS): {url}, using YouTube service")
+            logger.debug("🔄 Detected YouTube URL (not RSS): %s, using YouTube service", url)
             result = await youtube_service.fetch_feed(url)
 
             if result.get("success") and result.get("feed"):
-                logger.info(f"✅ YouTube service provided feed for {url}")
+                logger.debug("✅ YouTube service provided feed for %s", url)
                 return result
 
             logger.error(f"YouTube service failed for {url}")
@@ -200,11 +202,11 @@ class RSSService:
         # Check if this is a Reddit URL - if so, use Reddit service
         reddit_service = get_reddit_service()
         if reddit_service.is_reddit_url(url):
-            logger.info(f"🔄 Detected Reddit URL (not RSS): {url}, using Reddit service")
+            logger.debug("🔄 Detected Reddit URL (not RSS): %s, using Reddit service", url)
             result = await reddit_service.fetch_feed(url)
 
             if result.get("success") and result.get("feed"):
-                logger.info(f"✅ Reddit service provided feed for {url}")
+                logger.debug("✅ Reddit service provided feed for %s", url)
                 return result
 
             logger.error(f"Reddit service failed for {url}")
@@ -216,7 +218,41 @@ class RSSService:
         # Try to fetch from URL
         return await self._fetch_feed_from_url(url)
 
+    def _feed_from_cache(self, cached_dict: Dict[str, Any]) -> RSSFeed:
+        """Rebuild an RSSFeed from its cached dict"""
+        items = []
+        for item_dict in cached_dict.get("items", []):
+            # Convert pubDate string back to datetime if present
+            pub_date = None
+            if item_dict.get("pubDate"):
+                try:
+                    pub_date = date_parser.parse(item_dict["pubDate"])
+                except Exception:
+                    pass
+            items.append(RSSItem(**{**item_dict, "pub_date": pub_date}))
+
+        return RSSFeed(
+            items=items,
+            title=cached_dict.get("title"),
+            description=cached_dict.get("description"),
+            link=cached_dict.get("link"),
+        )
+
     async def _fetch_feed_from_url(self, url: str) -> Dict[str, Any]:
+        """Fetch feed from a specific URL, joining a fetch of the same URL already in progress
+
+        Chats subscribed to the same feed are checked concurrently and would otherwise all
+        miss the cache and download it at once.
+        """
+        task = self._inflight_fetches.get(url)
+        if task is None:
+            task = asyncio.create_task(self._fetch_feed_from_url_uncoalesced(url))
+            self._inflight_fetches[url] = task
+            task.add_done_callback(lambda _: self._inflight_fetches.pop(url, None))
+        # Shielded so one cancelled caller doesn't cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    async def _fetch_feed_from_url_uncoalesced(self, url: str) -> Dict[str, Any]:
         """Fetch feed from a specific URL"""
 
         # Check circuit breaker
@@ -225,50 +261,22 @@ class RSSService:
             logger.warning(f"Circuit breaker OPEN for {url} - retry in {time_until_retry:.0f}s")
             return {"success": False, "error": "Circuit breaker open"}
 
-        # Check cache first
+        # Check cache first; the cached body outlives its freshness window so a 304 can
+        # revalidate it without downloading and parsing the feed again
         cached_dict = await cache_service.get(f"feed:{url}")
-        if cached_dict:
-            # Convert cached dict back to RSSFeed
-            items = []
-            for item_dict in cached_dict.get("items", []):
-                # Convert pubDate string back to datetime if present
-                pub_date = None
-                if item_dict.get("pubDate"):
-                    try:
-                        from dateutil import parser as date_parser
-
-                        pub_date = date_parser.parse(item_dict["pubDate"])
-                    except Exception:
-                        pass
-                item_dict["pub_date"] = pub_date
-                items.append(RSSItem(**item_dict))
-
-            # DEBUG: Log cache results
-            logger.debug(f"🔍 Using cached feed for {url}: {len(items)} items from cache")
-            if items:
-                logger.debug(
-                    f"🔍 Cached first item: id={items[0].id}, title={items[0].title[:50]}, pub_date={items[0].pub_date.isoformat() if items[0].pub_date else 'N/A'}"
-                )
-                # Cache has items - use it
-                feed = RSSFeed(
-                    items=items,
-                    title=cached_dict.get("title"),
-                    description=cached_dict.get("description"),
-                    link=cached_dict.get("link"),
-                )
-                logger.debug(f"Using cached feed: {url}")
-                return {"success": True, "feed": feed}
-            else:
-                # Cache returned empty - clear it and force refetch
-                logger.warning(
-                    f"⚠️ Cache returned empty feed for {url} - clearing cache and will refetch"
-                )
-                await cache_service.delete(f"feed:{url}")
-                await cache_service.delete(f"feed_meta:{url}")
-                # Fall through to fetch fresh data below
+        if cached_dict and not cached_dict.get("items"):
+            # Cache returned empty - clear it and force refetch
+            logger.warning(
+                f"⚠️ Cache returned empty feed for {url} - clearing cache and will refetch"
+            )
+            await cache_service.delete(f"feed:{url}")
+            await cache_service.delete(f"feed_meta:{url}")
+            cached_dict = None
 
-        if not self._session:
-            await self.initialize()
+        if cached_dict and time.time() - cached_dict.get("fetched_at", 0) < FEED_FRESH_TTL:
+            feed = self._feed_from_cache(cached_dict)
+            logger.debug("Using cached feed: %s (%d items)", url, len(feed.items))
+            return {"success": True, "feed": feed}
 
         last_error: Optional[Exception] = None
 
@@ -286,8 +294,8 @@ class RSSService:
                 # Build headers with randomization
                 headers = header_builder.build_headers(url, user_agent)
 
-                # Add conditional headers if cached
-                cached_entry = await cache_service.get(f"feed_meta:{url}")
+                # Add conditional headers if a body is cached to fall back on for a 304
+                cached_entry = await cache_service.get(f"feed_meta:{url}") if cached_dict else None
                 if cached_entry:
                     if cached_entry.get("etag"):
                         headers["If-None-Match"] = cached_entry["etag"]
@@ -296,52 +304,27 @@ class RSSService:
 
                 # Get session from session manager (domain-aware with rotation)
                 session = await session_manager.get_session(domain)
-                async with session.get(url, headers=headers) as response:
+                async with session.get(
+                    url, headers=headers, timeout=self._request_timeout
+                ) as response:
                     # Check if we got a 304 Not Modified response
                     if response.status == 304:
-                        # Get cached feed for 304 response
-                        cached_for_304 = await cache_service.get(f"feed:{url}")
-                        if cached_for_304:
-                            # Convert cached dict back to RSSFeed
-                            items = []
-                            for item_dict in cached_for_304.get("items", []):
-                                # Convert pubDate string back to datetime if present
-                                pub_date = None
-                                if item_dict.get("pubDate"):
-                                    try:
-                                        from dateutil import parser as date_parser
-
-                                        pub_date = date_parser.parse(item_dict["pubDate"])
-                                    except Exception:
-                                        pass
-                                item_dict["pub_date"] = pub_date
-                                items.append(RSSItem(**item_dict))
-
-                            # DEBUG: Log 304 cache results
-                            logger.debug(
-                                f"🔍 Received 304 Not Modified for {url}: {len(items)} items from cache"
-                            )
-                            if not items:
-                                logger.warning(
-                                    "⚠️ 304 cache returned empty feed - clearing cache and refetching"
-                                )
-                                await cache_service.delete(f"feed:{url}")
-                                await cache_service.delete(f"feed_meta:{url}")
-                                # Fall through to refetch
-                            else:
-                                feed = RSSFeed(
-                                    items=items,
-                                    title=cached_for_304.get("title"),
-                                    description=cached_for_304.get("description"),
-                                    link=cached_for_304.get("link"),
-                                )
-                                logger.debug(f"Received 304 Not Modified, using cached feed: {url}")
-                                return {"success": True, "feed": feed}
-                        else:
-                            logger.warning(
-                                f"⚠️ Received 304 but no cache found for {url} - refetching"
-                            )
-                            # Fall through to refetch
+                        if cached_dict:
+                            # Unchanged: reuse the cached items and restart their freshness window
+                            cached_dict["fetched_at"] = time.time()
+                            await cache_service.set(f"feed:{url}", cached_dict, ttl=FEED_CACHE_TTL)
+                            logger.debug("Received 304 Not Modified, using cached feed: %s", url)
+                            rate_limiter.record_success(domain)
+                            circuit_breaker.record_success(url)
+                            return {"success": True, "feed": self._feed_from_cache(cached_dict)}
+
+                        # Validators are only sent with a cached body, so this is a misbehaving
+                        # server; drop any stored validators and retry
+                        logger.warning(
+                            f"⚠️ Received 304 but no cache found for {url} - refetching"
+                        )
+                        await cache_service.delete(f"feed_meta:{url}")
+                        continue
 
                     if not response.ok:
                         error_msg = f"HTTP {response.status}: {response.reason}"
@@ -364,7 +347,7 @@ class RSSService:
                                 # Trigger alerts
                                 from app.bot import bot_service
 
-                                admin_chat_id = settings.allowed_user_id
+                                admin_chat_id = _ADMIN_CHAT_ID
                                 await blocking_alert_service.check_and_alert_on_block(
                                     domain=domain,
                                     status_code=response.status,
@@ -393,8 +376,9 @@ class RSSService:
                     # Read content
                     content = await response.text()
 
-                    # Parse feed
-                    parsed = feedparser.parse(content)
+                    # Parse feed in a worker thread; feedparser is synchronous and CPU-bound,
+                    # and would otherwise stall concurrent feed checks and Telegram sends
+                    parsed = await asyncio.to_thread(feedparser.parse, content)
 
                     if parsed.bozo:
                         error_msg = f"Feed parsing error: {parsed.bozo_exception}"
@@ -486,8 +470,9 @@ class RSSService:
                         "title": feed.title,
                         "description": feed.description,
                         "link": feed.link,
+                        "fetched_at": time.time(),
                     }
-                    await cache_service.set(f"feed:{url}", feed_dict, ttl=300)  # 5 minutes
+                    await cache_service.set(f"feed:{url}", feed_dict, ttl=FEED_CACHE_TTL)
 
                     if items:
                         logger.debug(f"Cached feed with {len(items)} items: {url}")
@@ -498,7 +483,7 @@ class RSSService:
                         await cache_service.set(
                             f"feed_meta:{url}",
                             {"etag": etag, "last_modified": last_modified},
-                            ttl=3600,  # 1 hour
+                            ttl=FEED_CACHE_TTL,
                         )
 
                     # Record success for rate limiter, UA pool, and circuit breaker
@@ -506,19 +491,12 @@ class RSSService:
                     user_agent_pool.record_success(domain, user_agent)
                     circuit_breaker.record_success(url)
 
-                    # Record success in database
-                    try:
-                        with database.get_session() as session:
-                            stats_service = BlockingStatsService(session)
-                            stats_service.record_request_success(
-                                domain=domain,
-                                user_agent=user_agent,
-                                delay=rate_limiter.get_current_delay(domain),
-                            )
-                            # Reset consecutive blocks on success
-                            blocking_alert_service.reset_consecutive_blocks(domain)
-                    except Exception as e:
-                        logger.error(f"Failed to record success stats: {e}")
+                    # Record success; buffered and written to the database periodically
+                    success_stats_buffer.record(
+                        domain, user_agent=user_agent, delay=rate_limiter.get_current_delay(domain)
+                    )
+                    # Reset consecutive blocks on success
+                    blocking_alert_service.reset_consecutive_blocks(domain)
 
                     return {"success": True, "feed": feed}
 
@@ -588,6 +566,7 @@ class RSSService:
             'totalItemsCount': int,
             'lastItemIdToSave': Optional[str],
             'firstItemId': Optional[str],
+            'firstItemPubDate': Optional[datetime],  # first-time processing only
         }
         """
         result = await self.fetch_feed(url)
@@ -607,14 +586,17 @@ class RSSService:
 
         # If no last item ID, this is the first time processing this feed
         if not last_item_id:
-            logger.info(
-                f"No lastItemId for {url} - First time processing, returning empty (will not process old items)"
+            logger.debug(
+                "No lastItemId for %s - First time processing, returning empty "
+                "(will not process old items)",
+                url,
             )
             return {
                 "items": [],
                 "totalItemsCount": total_items_count,
                 "lastItemIdToSave": first_item_id,
                 "firstItemId": first_item_id,
+                "firstItemPubDate": first_item.pub_date,
             }
 
         # SIMPLIFIED: Check ALL items in the feed for posts newer than lastNotifiedAt
@@ -629,96 +611,93 @@ class RSSService:
                 "firstItemId": first_item_id,
             }
 
+        # Per-item diagnostics below format dates for every item; only build them when
+        # debug output is enabled
+        debug = logger.isEnabledFor(logging.DEBUG)
+
         # Check ALL items for posts newer than lastNotifiedAt
         # This is necessary because Reddit feeds are sorted by popularity, not by date
-        logger.debug(
-            f"🔍 Checking ALL {len(items)} items for posts newer than lastNotifiedAt {last_item_date.isoformat()}"
-        )
-
-        # Log all items with their dates for debugging
         items_with_dates = [item for item in items if item.pub_date]
         items_without_dates = [item for item in items if not item.pub_date]
 
-        if items_with_dates:
-            all_dates = [item.pub_date.isoformat() for item in items_with_dates]
-            all_ids = [item.id for item in items_with_dates]
+        if debug:
             logger.debug(
-                f"🔍 Items with dates ({len(items_with_dates)}): IDs={', '.join(all_ids[:5])}, Dates={', '.join(all_dates[:5])}"
+                "🔍 Checking ALL %d items for posts newer than lastNotifiedAt %s",
+                len(items),
+                last_item_date.isoformat(),
             )
+            if items_with_dates:
+                logger.debug(
+                    "🔍 Items with dates (%d): IDs=%s, Dates=%s",
+                    len(items_with_dates),
+                    ", ".join(item.id for item in items_with_dates[:5]),
+                    ", ".join(item.pub_date.isoformat() for item in items_with_dates[:5]),
+                )
 
         if items_without_dates:
             logger.warning(
-                f"⚠️ Found {len(items_without_dates)} items without dates: {', '.join([item.id for item in items_without_dates[:5]])}"
+                "⚠️ Found %d items without dates: %s",
+                len(items_without_dates),
+                ", ".join(item.id for item in items_without_dates[:5]),
             )
 
-        new_items = []
-        for item in items:
-            if item.pub_date:
-                is_newer = item.pub_date > last_item_date
-                logger.debug(
-                    f"🔍 Checking item {item.id}: date={item.pub_date.isoformat()}, "
-                    f"lastNotifiedAt={last_item_date.isoformat()}, is_newer={is_newer}"
-                )
-                if is_newer:
-                    new_items.append(item)
-                    logger.info(
-                        f"✅ Found new post: {item.id} (title: {item.title[:50]}) - date {item.pub_date.isoformat()} is newer than "
-                        f"lastNotifiedAt {last_item_date.isoformat()}"
+        new_items = [item for item in items_with_dates if item.pub_date > last_item_date]
+
+        if debug:
+            for item in items:
+                if item.pub_date:
+                    logger.debug(
+                        "🔍 Checking item %s: date=%s, lastNotifiedAt=%s, is_newer=%s",
+                        item.id,
+                        item.pub_date.isoformat(),
+                        last_item_date.isoformat(),
+                        item.pub_date > last_item_date,
                     )
-            else:
-                logger.debug(f"🔍 Skipping item {item.id} - no pub_date")
+                else:
+                    logger.debug("🔍 Skipping item %s - no pub_date", item.id)
 
         # Sort new items by date (most recent first)
         if new_items:
             new_items.sort(key=lambda x: x.pub_date or datetime.min, reverse=True)
-            # Format new posts list (avoid backslash in f-string)
-            new_posts_str = ", ".join(
-                [
-                    f'{item.id} ({item.pub_date.isoformat() if item.pub_date else "no date"})'
-                    for item in new_items[:5]
-                ]
-            )
-            logger.info(
-                f"✅ Found {len(new_items)} new post(s) out of {total_items_count} total items. "
-                f"New posts: {new_posts_str}"
-            )
+            if debug:
+                logger.debug(
+                    "✅ Found %d new post(s) out of %d total items. New posts: %s",
+                    len(new_items),
+                    total_items_count,
+                    ", ".join(
+                        f"{item.id} ({item.pub_date.isoformat()})" for item in new_items[:5]
+                    ),
+                )
             return {
                 "items": new_items,
                 "totalItemsCount": total_items_count,
                 "lastItemIdToSave": None,
                 "firstItemId": first_item_id,
             }
+
+        # Log why no items were found with detailed comparison
+        if items_with_dates:
+            if debug:
+                newest_date = max(item.pub_date for item in items_with_dates)
+                oldest_date = min(item.pub_date for item in items_with_dates)
+                logger.debug(
+                    "ℹ️ No new posts found. Feed date range: %s to %s, lastNotifiedAt: %s. "
+                    "Newest item (%s) %s than baseline.",
+                    oldest_date.isoformat(),
+                    newest_date.isoformat(),
+                    last_item_date.isoformat(),
+                    newest_date.isoformat(),
+                    "IS newer" if newest_date > last_item_date else "is NOT newer",
+                )
         else:
-            # Log why no items were found with detailed comparison
-            if items:
-                if items_with_dates:
-                    newest_date = max(item.pub_date for item in items_with_dates)
-                    oldest_date = min(item.pub_date for item in items_with_dates)
-                    logger.debug(
-                        f"ℹ️ No new posts found. Feed date range: {oldest_date.isoformat()} to {newest_date.isoformat()}, "
-                        f"lastNotifiedAt: {last_item_date.isoformat()}. "
-                        f"Newest item ({newest_date.isoformat()}) {'IS newer' if newest_date > last_item_date else 'is NOT newer'} than baseline."
-                    )
-                    # Show detailed comparison for each item
-                    logger.debug("🔍 Detailed comparison:")
-                    for item in items_with_dates[:5]:
-                        logger.debug(
-                            f"  - {item.id}: {item.pub_date.isoformat()} vs {last_item_date.isoformat()} = "
-                            f"{'✅ NEWER' if item.pub_date > last_item_date else '❌ older'}"
-                        )
-                else:
-                    logger.warning(
-                        f"⚠️ No new posts: Feed has {len(items)} items but none have dates"
-                    )
-            else:
-                logger.warning("⚠️ No new posts: Feed is empty")
+            logger.warning("⚠️ No new posts: Feed has %d items but none have dates", len(items))
 
-            return {
-                "items": [],
-                "totalItemsCount": total_items_count,
-                "lastItemIdToSave": None,
-                "firstItemId": first_item_id,
-            }
+        return {
+            "items": [],
+            "totalItemsCount": total_items_count,
+            "lastItemIdToSave": None,
+            "firstItemId": first_item_id,
+        }
 
     async def validate_feed_url(self, url: str) -> bool:
         """Validate if a URL is a valid RSS feed"""
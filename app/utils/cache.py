@@ -1,6 +1,6 @@
 """Redis cache service using redis"""
 
-from typing import Optional, Any
+from typing import Optional, Any, List
 import json
 from redis.asyncio import Redis
 from redis.asyncio.connection import ConnectionPool
@@ -99,6 +99,24 @@ class CacheService:
             logger.error(f"Failed to check cache key {key}: {e}")
             return False
 
+    async def add_many(self, keys: List[str], ttl: int) -> List[bool]:
+        """Set marker keys that don't exist yet (SET NX EX) in one pipeline
+
+        Returns, per key, whether it was newly added. When Redis is unavailable every key
+        is reported as new, so callers fall back to their own checks.
+        """
+        if self.disabled or not self.redis or not keys:
+            return [True] * len(keys)
+
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.set(key, 1, nx=True, ex=ttl)
+                return [bool(added) for added in await pipe.execute()]
+        except Exception as e:
+            logger.error(f"Failed to add {len(keys)} cache key(s): {e}")
+            return [True] * len(keys)
+
     async def ping(self) -> bool:
         """Ping Redis server"""
         if self.disabled or not self.redis:
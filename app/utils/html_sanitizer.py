@@ -1,8 +1,57 @@
 """HTML sanitization for Telegram messages"""
 
 import re
+from functools import lru_cache
 from html import escape, unescape
 
+# Patterns are compiled once at import; sanitizing runs for every field of every notification
+_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+_SCRIPT_RE = re.compile(r"<script[^>]*>.*?</script>", re.DOTALL | re.IGNORECASE)
+_STYLE_RE = re.compile(r"<style[^>]*>.*?</style>", re.DOTALL | re.IGNORECASE)
+# (pattern, tag, Telegram equivalent)
+_EQUIVALENT_TAGS = [
+    (re.compile(rf"</?{tag}>", re.IGNORECASE), tag, replacement)
+    for tag, replacement in (
+        ("strong", "b"),
+        ("em", "i"),
+        ("ins", "u"),
+        ("strike", "s"),
+        ("del", "s"),
+    )
+]
+_A_OPEN_RE = re.compile(r"<a[^>]*>", re.IGNORECASE)
+_HREF_RE = re.compile(r'href\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+# (opening pattern, closing pattern, tag) for allowed tags whose attributes are dropped
+_ATTRIBUTE_TAGS = [
+    (
+        re.compile(rf"<{tag}[^>]*>", re.IGNORECASE),
+        re.compile(rf"</{tag}[^>]*>", re.IGNORECASE),
+        tag,
+    )
+    for tag in ("b", "i", "u", "s", "code", "pre")
+]
+_ANY_TAG_RE = re.compile(r"<[^>]+>")
+_ALLOWED_TAG_RE = re.compile(r"</?(?:b|i|u|s|code|pre|a)", re.IGNORECASE)
+_SPACES_RE = re.compile(r"[ \t]+")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n\s*\n+")
+_BALANCE_TAG_RE = re.compile(r"<(/?)([a-zA-Z]+)(?:\s[^>]*)?>", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+# Tags Telegram accepts, and anything is_valid_telegram_html must inspect: a tag, a raw
+# angle bracket, or an ampersand that doesn't start an entity
+_TELEGRAM_TAGS = frozenset({"b", "i", "u", "s", "a", "code", "pre"})
+_MARKUP_RE = re.compile(
+    r"<(/?)([a-zA-Z]+)(?:\s[^<>]*)?>|[<>]|&(?!#\d+;|#x[0-9a-fA-F]+;|[a-zA-Z]+;)"
+)
+
+
+@lru_cache(maxsize=None)
+def _tag_patterns(tag_name: str):
+    """Compiled (opening, closing) patterns for a tag name"""
+    return (
+        re.compile(rf"<{tag_name}(?:\s[^>]*)?>|<{tag_name}>", re.IGNORECASE),
+        re.compile(rf"</{tag_name}>", re.IGNORECASE),
+    )
+
 
 def sanitize_html_for_telegram(text: str) -> str:
     """
@@ -25,28 +74,21 @@ def sanitize_html_for_telegram(text: str) -> str:
 
     # Step 1: Remove HTML comments FIRST (most common issue: <!-- -->)
     # This regex matches <!-- ... --> including multi-line comments
-    text = re.sub(r"<!--.*?-->", "", text, flags=re.DOTALL)
+    text = _COMMENT_RE.sub("", text)
 
     # Step 2: Remove script and style tags and their content completely
-    text = re.sub(r"<script[^>]*>.*?</script>", "", text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r"<style[^>]*>.*?</style>", "", text, flags=re.DOTALL | re.IGNORECASE)
+    text = _SCRIPT_RE.sub("", text)
+    text = _STYLE_RE.sub("", text)
 
     # Step 3: Replace equivalent tags with Telegram-supported ones
     # Telegram supports: <b>, <i>, <u>, <s>, <code>, <pre>, <a href="url">
     # Equivalents: <strong>, <em>, <ins>, <strike>, <del>
-    text = re.sub(
-        r"</?strong>", lambda m: m.group(0).replace("strong", "b"), text, flags=re.IGNORECASE
-    )
-    text = re.sub(r"</?em>", lambda m: m.group(0).replace("em", "i"), text, flags=re.IGNORECASE)
-    text = re.sub(r"</?ins>", lambda m: m.group(0).replace("ins", "u"), text, flags=re.IGNORECASE)
-    text = re.sub(
-        r"</?strike>", lambda m: m.group(0).replace("strike", "s"), text, flags=re.IGNORECASE
-    )
-    text = re.sub(r"</?del>", lambda m: m.group(0).replace("del", "s"), text, flags=re.IGNORECASE)
+    for pattern, tag, replacement in _EQUIVALENT_TAGS:
+        text = pattern.sub(lambda m: m.group(0).replace(tag, replacement), text)
 
     # Step 4: Clean up <a> tags - keep only href attribute
     def clean_a_tag(match):
-        href_match = re.search(r'href\s*=\s*["\']([^"\']+)["\']', match.group(0), re.IGNORECASE)
+        href_match = _HREF_RE.search(match.group(0))
         if href_match:
             href = href_match.group(1)
             # Escape special characters in href but keep it valid
@@ -54,7 +96,7 @@ def sanitize_html_for_telegram(text: str) -> str:
             return f'<a href="{href}">'
         return "<a>"
 
-    text = re.sub(r"<a[^>]*>", clean_a_tag, text, flags=re.IGNORECASE)
+    text = _A_OPEN_RE.sub(clean_a_tag, text)
 
     # Step 4.5: Remove any orphaned </a> tags that don't have matching opening tags
     # This is a common issue with malformed HTML from Reddit
@@ -62,9 +104,9 @@ def sanitize_html_for_telegram(text: str) -> str:
 
     # Step 5: Remove attributes from other allowed tags (keep only tag name)
     # Allowed tags: b, i, u, s, code, pre
-    for tag in ["b", "i", "u", "s", "code", "pre"]:
-        text = re.sub(rf"<{tag}[^>]*>", f"<{tag}>", text, flags=re.IGNORECASE)
-        text = re.sub(rf"</{tag}[^>]*>", f"</{tag}>", text, flags=re.IGNORECASE)
+    for opening_re, closing_re, tag in _ATTRIBUTE_TAGS:
+        text = opening_re.sub(f"<{tag}>", text)
+        text = closing_re.sub(f"</{tag}>", text)
 
     # Step 6: Remove all other HTML tags (not in allowed list)
     # Allowed tags pattern: <b>, </b>, <i>, </i>, <u>, </u>, <s>, </s>, <code>, </code>, <pre>, </pre>, <a href="...">
@@ -76,7 +118,7 @@ def sanitize_html_for_telegram(text: str) -> str:
         nonlocal placeholder_counter
         tag_content = match.group(0)
         # Check if it's an allowed tag
-        if re.match(r"</?(?:b|i|u|s|code|pre|a)", tag_content, re.IGNORECASE):
+        if _ALLOWED_TAG_RE.match(tag_content):
             placeholder = f"__TAG_PLACEHOLDER_{placeholder_counter}__"
             tag_placeholders[placeholder] = tag_content
             placeholder_counter += 1
@@ -84,7 +126,7 @@ def sanitize_html_for_telegram(text: str) -> str:
         return ""  # Remove unsupported tags
 
     # Replace all tags with placeholders or remove them
-    text = re.sub(r"<[^>]+>", protect_allowed_tag, text)
+    text = _ANY_TAG_RE.sub(protect_allowed_tag, text)
 
     # Step 7: Escape HTML entities in text content (between tags)
     # First unescape to avoid double escaping
@@ -105,8 +147,8 @@ def sanitize_html_for_telegram(text: str) -> str:
 
     # Step 10: Final cleanup - remove any stray problematic characters
     # Clean up whitespace but preserve intentional line breaks
-    text = re.sub(r"[ \t]+", " ", text)  # Multiple spaces to single space
-    text = re.sub(r"\n\s*\n\s*\n+", "\n\n", text)  # Multiple newlines to double newline
+    text = _SPACES_RE.sub(" ", text)  # Multiple spaces to single space
+    text = _BLANK_LINES_RE.sub("\n\n", text)  # Multiple newlines to double newline
 
     return text.strip()
 
@@ -126,14 +168,13 @@ def _remove_orphaned_closing_tags(text: str, tag_name: str) -> str:
         return ""
 
     # Count opening and closing tags
-    opening_pattern = rf"<{tag_name}(?:\s[^>]*)?>|<{tag_name}>"
-    closing_pattern = rf"</{tag_name}>"
+    opening_re, closing_re = _tag_patterns(tag_name)
 
     # Find all tags with their positions
     tags = []
-    for match in re.finditer(opening_pattern, text, re.IGNORECASE):
+    for match in opening_re.finditer(text):
         tags.append(("open", match.start(), match.end()))
-    for match in re.finditer(closing_pattern, text, re.IGNORECASE):
+    for match in closing_re.finditer(text):
         tags.append(("close", match.start(), match.end()))
 
     # Sort by position
@@ -180,10 +221,9 @@ def _balance_html_tags(text: str) -> str:
     self_closing_tags = {"a"}
 
     # Find all tags in the text
-    tag_pattern = r"<(/?)([a-zA-Z]+)(?:\s[^>]*)?>"
     tags = []
 
-    for match in re.finditer(tag_pattern, text, re.IGNORECASE):
+    for match in _BALANCE_TAG_RE.finditer(text):
         is_closing = bool(match.group(1))
         tag_name = match.group(2).lower()
         start_pos = match.start()
@@ -273,10 +313,10 @@ def strip_html_tags(text: str) -> str:
         return ""
 
     # Remove HTML comments
-    text = re.sub(r"<!--.*?-->", "", text, flags=re.DOTALL)
+    text = _COMMENT_RE.sub("", text)
 
     # Remove all HTML tags
-    text = re.sub(r"<[^>]+>", "", text)
+    text = _ANY_TAG_RE.sub("", text)
 
     # Unescape HTML entities
     try:
@@ -285,7 +325,36 @@ def strip_html_tags(text: str) -> str:
         pass
 
     # Clean up whitespace
-    text = re.sub(r"\s+", " ", text)
+    text = _WHITESPACE_RE.sub(" ", text)
     text = text.strip()
 
     return text
+
+
+def is_valid_telegram_html(text: str) -> bool:
+    """
+    Check that text can be sent with Telegram's HTML parse mode.
+
+    Only supported tags may appear, they must be properly nested and closed, and every
+    other <, > and & must be escaped.
+
+    Args:
+        text: HTML message text
+
+    Returns:
+        True if Telegram should accept the markup
+    """
+    stack = []
+    for match in _MARKUP_RE.finditer(text):
+        tag_name = match.group(2)
+        if tag_name is None:
+            return False  # Raw bracket or bare ampersand
+        tag_name = tag_name.lower()
+        if tag_name not in _TELEGRAM_TAGS:
+            return False
+        if match.group(1):
+            if not stack or stack.pop() != tag_name:
+                return False
+        else:
+            stack.append(tag_name)
+    return not stack
@@ -21,12 +21,6 @@ def configure_third_party_loggers(log_level: int):
     # Uvicorn error logs
     logging.getLogger("uvicorn.error").setLevel(logging.WARNING)
 
-    # APScheduler - reduce verbosity
-    if log_level > logging.DEBUG:
-        logging.getLogger("apscheduler").setLevel(logging.WARNING)
-    else:
-        logging.getLogger("apscheduler").setLevel(log_level)
-
     # Aiohttp - reduce verbosity
     logging.getLogger("aiohttp").setLevel(logging.WARNING)
 
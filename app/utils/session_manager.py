@@ -2,7 +2,13 @@
 
 import time
 import aiohttp
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
+
+# Connection pool shared by all domain sessions (keep-alive survives session rotation)
+POOL_LIMIT = 20
+POOL_LIMIT_PER_HOST = 4
+DNS_CACHE_TTL = 300  # seconds
+KEEPALIVE_TIMEOUT = 75  # seconds
 
 
 class SessionManager:
@@ -13,6 +19,18 @@ class SessionManager:
             {}
         )  # domain -> (session, created_at)
         self.session_ttl = session_ttl  # 1 hour
+        self._connector: Optional[aiohttp.TCPConnector] = None
+
+    def _get_connector(self) -> aiohttp.TCPConnector:
+        """Get the shared connector, creating it on first use inside the event loop"""
+        if self._connector is None or self._connector.closed:
+            self._connector = aiohttp.TCPConnector(
+                limit=POOL_LIMIT,
+                limit_per_host=POOL_LIMIT_PER_HOST,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+            )
+        return self._connector
 
     async def get_session(self, domain: str) -> aiohttp.ClientSession:
         """Get or create session for domain"""
@@ -24,9 +42,10 @@ class SessionManager:
                 # Session expired, close and create new
                 await session.close()
 
-        # Create new session
+        # Create new session (own cookie jar, shared connection pool)
         session = aiohttp.ClientSession(
-            connector=aiohttp.TCPConnector(limit_per_host=5),
+            connector=self._get_connector(),
+            connector_owner=False,
             cookie_jar=aiohttp.CookieJar(),
         )
         self.sessions[domain] = (session, time.time())
@@ -37,6 +56,9 @@ class SessionManager:
         for session, _ in self.sessions.values():
             await session.close()
         self.sessions.clear()
+        if self._connector is not None:
+            await self._connector.close()
+            self._connector = None
 
     async def close_session(self, domain: str):
         """Close specific domain session"""
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import sys
 import uvicorn
 from app.main import app
 from app.config import settings
@@ -23,5 +24,7 @@ if __name__ == "__main__":
         log_level=settings.log_level.lower(),
         reload=settings.environment == "development",
         access_log=settings.environment != "production" or log_level_value < logging.INFO,
+        # uvloop has no Windows build; fall back to the stdlib loop there
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
     )
 